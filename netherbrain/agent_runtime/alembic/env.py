@@ -13,7 +13,7 @@ from alembic import context
 from sqlalchemy import create_engine, pool
 
 from netherbrain.agent_runtime.db.tables import Base
-from netherbrain.agent_runtime.settings import NetherSettings
+from netherbrain.agent_runtime.settings import get_settings
 
 # -- Alembic Config object ----------------------------------------------------
 config = context.config
@@ -24,19 +24,19 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 # -- Database URL from app settings -------------------------------------------
-settings = NetherSettings()
+settings = get_settings()
 if not settings.database_url:
     msg = "NETHER_DATABASE_URL is not set. Cannot run migrations."
     raise RuntimeError(msg)
 
 
 def get_url() -> str:
-    """Return the database URL, converting asyncpg dialect if needed."""
+    """Return the database URL (already normalised to psycopg3 by settings)."""
     url = settings.database_url
     if url is None:  # pragma: no cover
         msg = "database_url is None"
         raise RuntimeError(msg)
-    return url.replace("postgresql+asyncpg://", "postgresql+psycopg://")
+    return url
 
 
 def include_object(obj: Any, name: str | None, type_: str, reflected: bool, compare_to: Any) -> bool:
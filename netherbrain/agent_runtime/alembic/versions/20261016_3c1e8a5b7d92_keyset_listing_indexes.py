@@ -0,0 +1,44 @@
+"""keyset listing indexes
+
+Revision ID: 3c1e8a5b7d92
+Revises: 974476417341
+Create Date: 2026-10-16 11:02:17.504913
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1e8a5b7d92"
+down_revision: str | None = "974476417341"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Composite indexes matching the keyset listing order; they also cover
+    # the plain user_id / conversation_id lookups the old indexes served.
+    op.drop_index("ix_conversations_user_id", table_name="conversations")
+    op.create_index(
+        "ix_conversations_user_id_created_at",
+        "conversations",
+        ["user_id", "created_at", "conversation_id"],
+        unique=False,
+    )
+    op.drop_index("ix_sessions_conversation_id", table_name="sessions")
+    op.create_index(
+        "ix_sessions_conversation_id_created_at",
+        "sessions",
+        ["conversation_id", "created_at", "session_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_conversation_id_created_at", table_name="sessions")
+    op.create_index("ix_sessions_conversation_id", "sessions", ["conversation_id"], unique=False)
+    op.drop_index("ix_conversations_user_id_created_at", table_name="conversations")
+    op.create_index("ix_conversations_user_id", "conversations", ["user_id"], unique=False)
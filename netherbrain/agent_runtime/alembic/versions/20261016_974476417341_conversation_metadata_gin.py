@@ -0,0 +1,39 @@
+"""conversation metadata gin index
+
+Revision ID: 974476417341
+Revises: f6fc4fb5d9f2
+Create Date: 2026-10-16 10:12:40.118532
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "974476417341"
+down_revision: str | None = "f6fc4fb5d9f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # GIN (jsonb_path_ops) index backing the ``metadata @> ...`` filter.
+    op.create_index(
+        "ix_conversations_metadata",
+        "conversations",
+        ["metadata"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_conversations_metadata",
+        table_name="conversations",
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
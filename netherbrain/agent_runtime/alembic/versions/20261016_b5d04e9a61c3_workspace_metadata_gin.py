@@ -0,0 +1,39 @@
+"""workspace metadata gin index
+
+Revision ID: b5d04e9a61c3
+Revises: 3c1e8a5b7d92
+Create Date: 2026-10-16 11:40:03.271946
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d04e9a61c3"
+down_revision: str | None = "3c1e8a5b7d92"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # GIN (jsonb_path_ops) index backing the ``metadata @> ...`` filter.
+    op.create_index(
+        "ix_workspaces_metadata",
+        "workspaces",
+        ["metadata"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_workspaces_metadata",
+        table_name="workspaces",
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
@@ -0,0 +1,28 @@
+"""workspace listing index
+
+Revision ID: e27a9c4f0b18
+Revises: b5d04e9a61c3
+Create Date: 2026-10-16 12:21:48.660215
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e27a9c4f0b18"
+down_revision: str | None = "b5d04e9a61c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Matches the keyset listing order (created_at DESC, workspace_id DESC),
+    # read backwards.
+    op.create_index("ix_workspaces_created_at", "workspaces", ["created_at", "workspace_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workspaces_created_at", table_name="workspaces")
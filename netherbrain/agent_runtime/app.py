@@ -1,11 +1,15 @@
+import asyncio
+import contextlib
+import hashlib
+import importlib
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import redis.asyncio as aioredis
-from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, Response
 from fastapi.routing import APIRouter
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
@@ -13,6 +17,7 @@ from sqlalchemy import text
 from sse_starlette.sse import AppStatus
 
 from netherbrain.agent_runtime.db.engine import create_engine, create_session_factory
+from netherbrain.agent_runtime.execution.input import close_http_client
 from netherbrain.agent_runtime.log import setup_logging
 from netherbrain.agent_runtime.managers.execution import ExecutionManager
 from netherbrain.agent_runtime.managers.sessions import SessionManager
@@ -22,6 +27,7 @@ from netherbrain.agent_runtime.registry import SessionRegistry
 from netherbrain.agent_runtime.settings import NetherSettings, get_settings
 from netherbrain.agent_runtime.store.base import StateStore
 from netherbrain.agent_runtime.store.local import LocalStateStore
+from netherbrain.agent_runtime.transport.redis_batcher import RedisStreamBatcher
 
 # ---------------------------------------------------------------------------
 # Shared singletons initialised during lifespan
@@ -52,6 +58,78 @@ def _create_state_store(settings: NetherSettings) -> StateStore:
     return LocalStateStore(settings.data_root, prefix=settings.data_prefix)
 
 
+async def _create_redis(redis_url: str) -> aioredis.Redis:
+    """Create the shared Redis client and open its first connection eagerly.
+
+    The initial ping means the first request does not pay the connect cost;
+    a failure is logged rather than fatal so ``/api/health`` can report it.
+    """
+    client = aioredis.from_url(
+        redis_url,
+        decode_responses=False,
+        socket_connect_timeout=5,
+        socket_timeout=5,
+        retry_on_timeout=True,
+        health_check_interval=30,
+        client_name=f"netherbrain-{os.getpid()}",
+    )
+    try:
+        await client.ping()  # type: ignore[misc]
+        logger.info("Redis: connected")
+    except Exception:
+        logger.exception("Redis: initial ping failed (will retry on demand)")
+    return client
+
+
+async def _close_infrastructure(_app: FastAPI) -> None:
+    """Release Redis and PostgreSQL resources held on ``app.state``."""
+    # Startup recovery still in flight would race the engine dispose below.
+    if _app.state.recovery_task is not None and not _app.state.recovery_task.done():
+        _app.state.recovery_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _app.state.recovery_task
+
+    # Flush queued stream events, then close Redis client (returns pooled connections).
+    if _app.state.redis_pipeline is not None:
+        await _app.state.redis_pipeline.stop()
+    if _app.state.redis is not None:
+        await _app.state.redis.aclose()
+        logger.info("Redis: closed")
+
+    # Close the shared input-download client (keep-alive sockets).
+    await close_http_client()
+
+    # Dispose DB engine (closes all pooled connections).
+    if _app.state.db_engine is not None:
+        await _app.state.db_engine.dispose()
+        logger.info("PostgreSQL: disposed")
+
+
+@asynccontextmanager
+async def _sse_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Own sse-starlette's shutdown signal for the lifetime of the app.
+
+    On enter, automatic graceful drain is disabled so SSE streams complete
+    naturally instead of being cut off when uvicorn receives a signal.  On
+    exit, streams are told to close.  The enclosing lifespan drains active
+    sessions *inside* this context, so every SSE connection gets to deliver
+    its terminal event before the close signal is sent.
+
+    ``app.state.sse_shutdown`` is set first so our own stream generators
+    (the Redis bridge) stop cooperatively on their next poll; sse-starlette's
+    ``AppStatus`` flag then closes whatever remains.
+    """
+    AppStatus.disable_automatic_graceful_drain()
+    AppStatus.should_exit = False
+    _app.state.sse_shutdown = asyncio.Event()
+    try:
+        yield
+    finally:
+        _app.state.sse_shutdown.set()
+        AppStatus.should_exit = True
+        logger.info("SSE: signalled streams to close")
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     # -- Startup ---------------------------------------------------------------
@@ -69,44 +147,42 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     logger.info("Data root: {} (store={}{})", settings.data_root, settings.state_store, prefix_info)
 
     # -- Initialise state fields (always present, possibly None) ----------------
+    # The root token is resolved once; rotating it requires a restart.
     _app.state.auth_token = auth_token
+    _app.state.auth_token_bytes = auth_token.encode()
     _app.state.jwt_secret = settings.jwt_secret
     _app.state.jwt_expiry_days = settings.jwt_expiry_days
     _app.state.db_engine = None
     _app.state.db_session_factory = None
     _app.state.redis = None
+    _app.state.redis_pipeline = None
     _app.state.session_manager = None
     _app.state.execution_manager = None
+    _app.state.recovery_task = None
     _app.state.shell_registry = ShellRegistry()
 
     # -- Database --------------------------------------------------------------
     if settings.database_url:
-        engine = create_engine(settings.database_url)
+        engine = create_engine(
+            settings.database_url,
+            expected_concurrency=settings.db_expected_concurrency,
+            pgbouncer=settings.db_use_pgbouncer,
+        )
         _app.state.db_engine = engine
         _app.state.db_session_factory = create_session_factory(engine)
-        logger.info("PostgreSQL: connected (pool_size=5, max_overflow=10)")
+        logger.info("PostgreSQL: connected ({}, pgbouncer={})", engine.pool.status(), settings.db_use_pgbouncer)
     else:
         logger.warning("NETHER_DATABASE_URL not set -- database features disabled")
 
     # -- Redis -----------------------------------------------------------------
     if settings.redis_url:
-        _app.state.redis = aioredis.from_url(
-            settings.redis_url,
-            decode_responses=False,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True,
-        )
-        logger.info("Redis: connected")
+        _app.state.redis = await _create_redis(settings.redis_url)
+        # Pipelines stream XADDs from all sessions (one RTT per batch).
+        _app.state.redis_pipeline = RedisStreamBatcher(_app.state.redis)
+        _app.state.redis_pipeline.start()
     else:
         logger.warning("NETHER_REDIS_URL not set -- stream transport disabled")
 
-    # -- SSE -------------------------------------------------------------------
-    # Let SSE streams complete naturally on shutdown instead of being
-    # terminated immediately.  Uvicorn's graceful shutdown will wait for
-    # open connections to close, giving active streams time to finish.
-    AppStatus.disable_automatic_graceful_drain()
-
     # -- Session manager -------------------------------------------------------
     if _app.state.db_session_factory is not None:
         store = _create_state_store(settings)
@@ -120,14 +196,13 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             settings=settings,
             session_factory=_app.state.db_session_factory,
             redis=_app.state.redis,
+            stream_batcher=_app.state.redis_pipeline,
         )
         logger.info("ExecutionManager: initialised")
 
-        # Startup recovery: mark orphaned sessions as failed.
-        async with _app.state.db_session_factory() as db:
-            recovered = await SessionManager.recover_orphaned_sessions(db)
-            if recovered > 0:
-                logger.info("Startup recovery: {} orphaned sessions marked as failed", recovered)
+        # Startup recovery: mark orphaned sessions as failed (in background;
+        # /api/ready reports 503 and session creation waits until it is done).
+        _app.state.recovery_task = _app.state.session_manager.start_recovery(_app.state.db_session_factory)
 
         # Bootstrap admin user if no users exist.
         from netherbrain.agent_runtime.managers.users import bootstrap_admin
@@ -135,46 +210,37 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         async with _app.state.db_session_factory() as db:
             await bootstrap_admin(db, password=settings.auth_token)
 
-    yield
+    # -- SSE -------------------------------------------------------------------
+    # Sessions are drained inside the SSE context; leaving it signals SSE
+    # streams to close, so that always happens after the terminal event.
+    async with _sse_lifespan(_app):
+        yield
+
+        # -- Shutdown ----------------------------------------------------------
+        logger.info(
+            "Agent Runtime shutting down (active_sessions={}, active_shells={})",
+            registry.active_count,
+            _app.state.shell_registry.active_count,
+        )
 
-    # -- Shutdown --------------------------------------------------------------
-    logger.info(
-        "Agent Runtime shutting down (active_sessions={}, active_shells={})",
-        registry.active_count,
-        _app.state.shell_registry.active_count,
-    )
+        # 0. Close all interactive shells.
+        await _app.state.shell_registry.shutdown()
 
-    # 0. Close all interactive shells.
-    await _app.state.shell_registry.shutdown()
-
-    # 1. Stop accepting new sessions.
-    registry.begin_shutdown()
-
-    # 2. Wait for active sessions to complete naturally.
-    if registry.active_count > 0:
-        timeout = settings.graceful_shutdown_timeout
-        logger.info("Waiting for {} active sessions to finish (timeout={}s)...", registry.active_count, timeout)
-        drained = await registry.wait_until_drained(timeout=timeout)
-        if not drained:
-            # Last resort: force-interrupt remaining sessions.
-            interrupted = registry.interrupt_all()
-            logger.warning("Force-interrupted {} sessions after timeout", interrupted)
-            await registry.wait_until_drained(timeout=5.0)
-
-    # 3. Signal SSE streams to close.  Must happen AFTER session drain so
-    #    that SSE connections can deliver the terminal event before closing.
-    AppStatus.should_exit = True
-    logger.info("SSE: signalled streams to close")
-
-    # Close Redis client (returns pooled connections).
-    if _app.state.redis is not None:
-        await _app.state.redis.aclose()
-        logger.info("Redis: closed")
+        # 1. Stop accepting new sessions.
+        registry.begin_shutdown()
 
-    # Dispose DB engine (closes all pooled connections).
-    if _app.state.db_engine is not None:
-        await _app.state.db_engine.dispose()
-        logger.info("PostgreSQL: disposed")
+        # 2. Wait for active sessions to complete naturally.
+        if registry.active_count > 0:
+            timeout = settings.graceful_shutdown_timeout
+            logger.info("Waiting for {} active sessions to finish (timeout={}s)...", registry.active_count, timeout)
+            drained = await registry.wait_until_drained(timeout=timeout)
+            if not drained:
+                # Last resort: force-interrupt remaining sessions.
+                interrupted = registry.interrupt_all()
+                logger.warning("Force-interrupted {} sessions after timeout", interrupted)
+                await registry.wait_until_drained(timeout=5.0)
+
+    await _close_infrastructure(_app)
 
 
 app = FastAPI(title="Netherbrain Agent Runtime", lifespan=lifespan)
@@ -219,33 +285,41 @@ async def health(request: Request) -> dict[str, str]:
     return result
 
 
-# -- CRUD routers ------------------------------------------------------------
-from netherbrain.agent_runtime.routers.auth import router as auth_router  # noqa: E402
-from netherbrain.agent_runtime.routers.conversations import router as conversations_router  # noqa: E402
-from netherbrain.agent_runtime.routers.files import router as files_router  # noqa: E402
-from netherbrain.agent_runtime.routers.keys import router as keys_router  # noqa: E402
-from netherbrain.agent_runtime.routers.model_presets import router as model_presets_router  # noqa: E402
-from netherbrain.agent_runtime.routers.notifications import router as notifications_router  # noqa: E402
-from netherbrain.agent_runtime.routers.presets import router as presets_router  # noqa: E402
-from netherbrain.agent_runtime.routers.sessions import router as sessions_router  # noqa: E402
-from netherbrain.agent_runtime.routers.shell import router as shell_router  # noqa: E402
-from netherbrain.agent_runtime.routers.toolsets import router as toolsets_router  # noqa: E402
-from netherbrain.agent_runtime.routers.users import router as users_router  # noqa: E402
-from netherbrain.agent_runtime.routers.workspaces import router as workspaces_router  # noqa: E402
-
-api.include_router(auth_router)
-api.include_router(users_router)
-api.include_router(keys_router)
-api.include_router(presets_router)
-api.include_router(workspaces_router)
-api.include_router(conversations_router)
-api.include_router(sessions_router)
-api.include_router(toolsets_router)
-api.include_router(model_presets_router)
-api.include_router(notifications_router)
-api.include_router(files_router)
-api.include_router(shell_router)
+@api.get("/ready")
+async def ready(request: Request) -> dict[str, str]:
+    """Readiness probe: 503 until startup recovery has finished."""
+    session_manager = request.app.state.session_manager
+    if session_manager is not None and not session_manager.recovered:
+        raise HTTPException(status_code=503, detail="Startup recovery in progress.")
+    return {"status": "ready"}
+
 
+# -- CRUD routers ------------------------------------------------------------
+# Mounted in this order; all must be registered before the SPA catch-all.
+_API_ROUTER_MODULES = (
+    "auth",
+    "users",
+    "keys",
+    "presets",
+    "workspaces",
+    "conversations",
+    "sessions",
+    "toolsets",
+    "model_presets",
+    "notifications",
+    "files",
+    "shell",
+)
+
+
+def _include_api_routers(parent: APIRouter) -> None:
+    """Import each ``routers.<name>`` module once and mount its ``router``."""
+    for name in _API_ROUTER_MODULES:
+        module = importlib.import_module(f"netherbrain.agent_runtime.routers.{name}")
+        parent.include_router(module.router)
+
+
+_include_api_routers(api)
 app.include_router(api)
 
 # ---------------------------------------------------------------------------
@@ -259,11 +333,46 @@ if _UI_DIR.is_dir():
     app.mount("/assets", StaticFiles(directory=_UI_DIR / "assets"), name="ui-assets")
 
     _ui_root = _UI_DIR.resolve()
+    # The built UI is immutable for the lifetime of the process, so index the
+    # servable files once instead of resolving + stat-ing on every request.
+    # Membership in this set also rules out path traversal.
+    _ui_files: frozenset[str] = frozenset(
+        p.relative_to(_ui_root).as_posix() for p in _ui_root.rglob("*") if p.is_file()
+    ) - {"index.html"}
+
+    # index.html answers most SPA routes, so it is held in memory with a
+    # content hash ETag ("no-cache" = always revalidate, usually a 304).
+    # A partial build without it must not break the API: SPA routes 404.
+    _ui_index_path = _ui_root / "index.html"
+    _ui_index_bytes = _ui_index_path.read_bytes() if _ui_index_path.is_file() else None
+    _ui_index_etag = f'"{hashlib.blake2b(_ui_index_bytes or b"", digest_size=16).hexdigest()}"'
+    _ui_index_headers = {"etag": _ui_index_etag, "cache-control": "no-cache"}
+
+    def _serve_file(path: Path, request: Request) -> Response | None:
+        """Serve *path* with a single ``stat``; 304 if the client's ETag matches.
+
+        Returns ``None`` if the file disappeared since startup.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        response = FileResponse(path, stat_result=st)
+        etag = response.headers["etag"]
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"etag": etag})
+        return response
+
+    def _serve_index(request: Request) -> Response:
+        if _ui_index_bytes is None:
+            return Response(status_code=404)
+        if request.headers.get("if-none-match") == _ui_index_etag:
+            return Response(status_code=304, headers=_ui_index_headers)
+        return Response(_ui_index_bytes, media_type="text/html", headers=_ui_index_headers)
 
     @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str) -> FileResponse:
+    async def serve_spa(full_path: str, request: Request) -> Response:
         """Serve the SPA index.html for all unmatched routes (client-side routing)."""
-        target = (_ui_root / full_path).resolve()
-        if _ui_root in target.parents and target.is_file():
-            return FileResponse(target)
-        return FileResponse(_ui_root / "index.html")
+        if full_path in _ui_files and (response := _serve_file(_ui_root / full_path, request)) is not None:
+            return response
+        return _serve_index(request)
@@ -23,12 +23,16 @@ if TYPE_CHECKING:
     from ya_agent_sdk.context import AgentContext
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeSession:
     """In-flight state for a single agent execution.
 
     Created by the execution coordinator at run start; registered in the
     SessionRegistry for interrupt / steering; discarded after commit.
+
+    Slotted: one instance lives per active run, and the registry reads its
+    fields on every lookup.  Undeclared attributes cannot be set -- add a
+    field here instead.
     """
 
     # -- Identity --------------------------------------------------------------
@@ -6,32 +6,119 @@ Uses psycopg3 which supports both sync and async with the same
 
 from __future__ import annotations
 
+from pydantic_core import from_json, to_json
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from netherbrain.agent_runtime.settings import PSYCOPG_URL_PREFIX
 
-def create_engine(database_url: str, **kwargs: object) -> AsyncEngine:
+DEFAULT_EXPECTED_CONCURRENCY = 15
+"""Concurrent DB tasks per worker assumed when the caller does not say."""
+
+_MAX_POOL_SIZE = 25
+
+_PREPARE_THRESHOLD = 3
+"""psycopg prepares a query server-side after this many executions (default 5)."""
+
+_QUERY_CACHE_SIZE = 1200
+"""SQLAlchemy compiled-statement cache entries (default 500)."""
+
+
+def pool_sizing(expected_concurrency: int) -> tuple[int, int]:
+    """Split *expected_concurrency* into ``(pool_size, max_overflow)``.
+
+    ``pool_size + max_overflow`` equals the number of concurrent tasks that
+    may hold a connection, so bursts never queue on the pool.  Half of it
+    (capped at 25) is kept warm; the rest is overflow that is closed again
+    once returned.
+    """
+    expected_concurrency = max(expected_concurrency, 1)
+    pool_size = max(min(expected_concurrency // 2, _MAX_POOL_SIZE), 1)
+    return pool_size, expected_concurrency - pool_size
+
+
+def create_engine(
+    database_url: str,
+    *,
+    expected_concurrency: int = DEFAULT_EXPECTED_CONCURRENCY,
+    pgbouncer: bool = False,
+    **kwargs: object,
+) -> AsyncEngine:
     """Create an async SQLAlchemy engine with production-ready pool settings.
 
     Default pool parameters are tuned for a small homelab service:
 
-    - **pool_size=5**: baseline connections kept open.
-    - **max_overflow=10**: burst capacity above pool_size.
+    - **pool_size / max_overflow**: derived from *expected_concurrency* via
+      :func:`pool_sizing` (7 + 8 for the default of 15).
     - **pool_pre_ping=True**: test connections before checkout to handle
       server-side disconnects (PG restarts, idle timeouts).
     - **pool_recycle=3600**: recycle connections after 1 hour to avoid
       issues with load-balancers or firewalls that drop idle TCP.
+    - **prepare_threshold=3**: the routers issue a small, stable set of
+      parameterised queries; psycopg prepares each server-side on its third
+      run so Postgres skips parse/plan from then on.
+    - **query_cache_size=1200**: room for every compiled statement the
+      routers and managers issue, so SQLAlchemy never recompiles them.
+
+    When *pgbouncer* is set (PgBouncer in transaction pooling mode), the
+    profile changes because the bouncer already owns server connections:
+
+    ============== ======= ========= ===========================================
+    Option         Direct  PgBouncer Why
+    ============== ======= ========= ===========================================
+    pool_pre_ping  True    False     ``SELECT 1`` per checkout pins a backend
+    pool_recycle   3600    60        bouncer drops idle client sockets early
+    pool_timeout   30      30        fail fast instead of queueing forever
+    prepare        3       off       server-side prepared statements do not
+                                     survive transaction-level backend swaps
+    ============== ======= ========= ===========================================
+
+    The pool class is pinned to ``AsyncAdaptedQueuePool`` rather than left
+    to dialect defaults.  The sync ``QueuePool`` waits on a thread lock, which
+    blocks the event loop and shows up as hung workers under load, so only
+    override ``poolclass`` with an asyncio-aware pool (or ``NullPool``;
+    sizing options are dropped for non-queue pools).
+
+    JSON/JSONB columns are encoded and decoded with ``pydantic_core``'s
+    Rust codec (``to_json`` / ``from_json``) instead of the stdlib ``json``
+    module.  SQLAlchemy installs both on psycopg's adapter map, so values go
+    straight to and from bytes on the wire.
 
     All defaults can be overridden via *kwargs*.
+
+    Raises:
+        ValueError: If *database_url* does not use the psycopg3 dialect.
     """
-    defaults = {
+    if not database_url.startswith(PSYCOPG_URL_PREFIX):
+        msg = f"database_url must use the {PSYCOPG_URL_PREFIX!r} dialect"
+        raise ValueError(msg)
+    pool_size, max_overflow = pool_sizing(expected_concurrency)
+    defaults: dict[str, object] = {
         "echo": False,
-        "pool_size": 5,
-        "max_overflow": 10,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
         "pool_pre_ping": True,
         "pool_recycle": 3600,
+        "query_cache_size": _QUERY_CACHE_SIZE,
+        "connect_args": {"prepare_threshold": _PREPARE_THRESHOLD},
+        "json_serializer": to_json,
+        "json_deserializer": from_json,
     }
-    defaults.update(kwargs)  # type: ignore[arg-type]
-    return create_async_engine(database_url, **defaults)
+    if pgbouncer:
+        defaults.update({
+            "pool_pre_ping": False,
+            "pool_recycle": 60,
+            "pool_timeout": 30,
+            "connect_args": {"prepare_threshold": None},
+        })
+    poolclass = kwargs.pop("poolclass", AsyncAdaptedQueuePool)
+    defaults["poolclass"] = poolclass
+    if not (isinstance(poolclass, type) and issubclass(poolclass, QueuePool)):
+        # Sizing options are only understood by queue pools (NullPool rejects them).
+        for key in ("pool_size", "max_overflow", "pool_timeout"):
+            defaults.pop(key, None)
+    defaults.update(kwargs)
+    return create_async_engine(database_url, **defaults)  # type: ignore[arg-type]
 
 
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -97,6 +97,15 @@ class Preset(Base):
 
 class Workspace(Base):
     __tablename__ = "workspaces"
+    __table_args__ = (
+        Index("ix_workspaces_created_at", "created_at", "workspace_id"),
+        Index(
+            "ix_workspaces_metadata",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
 
     workspace_id: Mapped[str] = mapped_column(primary_key=True)
     name: Mapped[str | None]
@@ -109,7 +118,7 @@ class Workspace(Base):
 class Conversation(Base):
     __tablename__ = "conversations"
     __table_args__ = (
-        Index("ix_conversations_user_id", "user_id"),
+        Index("ix_conversations_user_id_created_at", "user_id", "created_at", "conversation_id"),
         Index(
             "ix_conversations_title_trgm",
             "title",
@@ -122,6 +131,12 @@ class Conversation(Base):
             postgresql_using="gin",
             postgresql_ops={"summary": "gin_trgm_ops"},
         ),
+        Index(
+            "ix_conversations_metadata",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
     )
 
     conversation_id: Mapped[str] = mapped_column(primary_key=True)
@@ -141,7 +156,7 @@ class Conversation(Base):
 class Session(Base):
     __tablename__ = "sessions"
     __table_args__ = (
-        Index("ix_sessions_conversation_id", "conversation_id"),
+        Index("ix_sessions_conversation_id_created_at", "conversation_id", "created_at", "session_id"),
         Index("ix_sessions_status", "status"),
         Index(
             "ix_sessions_final_message_trgm",
@@ -19,20 +19,27 @@ to completion regardless of consumer speed or disconnection.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, Any
+from functools import cache, partial
+from types import UnionType
+from typing import TYPE_CHECKING, Any, TypeIs, Union, get_args, get_origin
 
 from ag_ui.core import BaseEvent
+from pydantic import BaseModel, TypeAdapter
 from pydantic_ai import DeferredToolRequests, DeferredToolResults
-from pydantic_ai.messages import ModelMessagesTypeAdapter, ToolReturn
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ToolReturn
 from pydantic_ai.tools import ToolApproved, ToolDenied
+from y_agent_environment.resources import ResourceRegistryState
 from ya_agent_sdk.agents.main import AgentInterrupted, stream_agent
 from ya_agent_sdk.context import ResumableState, StreamEvent
 
 from netherbrain.agent_runtime.context import RuntimeSession
+from netherbrain.agent_runtime.execution.delegate import DelegateContext, create_spawn_delegate_tool
+from netherbrain.agent_runtime.execution.environment import resolve_project_paths
 from netherbrain.agent_runtime.execution.events import (
     MAIN_AGENT_ID,
     ModelUsage,
@@ -114,8 +121,12 @@ def build_deferred_tool_results(
     if not metadata:
         return None
 
-    approvals = _collect_approvals(user_interactions)
-    calls = _collect_calls(tool_results)
+    if user_interactions or tool_results:
+        approvals = _collect_approvals(user_interactions)
+        calls = _collect_calls(tool_results)
+    else:
+        # No feedback at all: everything pending gets the automatic answer.
+        approvals, calls = {}, {}
     _fill_uncovered(metadata, approvals, calls)
 
     if not approvals and not calls:
@@ -128,29 +139,23 @@ def build_deferred_tool_results(
     )
 
 
+# Shared, never-mutated decision objects (pydantic-ai only reads them).
+_APPROVED = ToolApproved()
+_DENIED = ToolDenied()
+_AUTO_DENIED = ToolDenied(message="Auto-denied: no response provided")
+_AUTO_FAILED = ToolReturn(return_value="Auto-failed: no result provided")
+
+
 def _collect_approvals(
     interactions: Sequence[UserInteraction] | None,
 ) -> dict[str, bool | ToolApproved | ToolDenied]:
-    approvals: dict[str, bool | ToolApproved | ToolDenied] = {}
-    if interactions:
-        for interaction in interactions:
-            if interaction.approved:
-                approvals[interaction.tool_call_id] = ToolApproved()
-            else:
-                approvals[interaction.tool_call_id] = ToolDenied()
-    return approvals
+    return {i.tool_call_id: _APPROVED if i.approved else _DENIED for i in interactions or ()}
 
 
 def _collect_calls(
     results: Sequence[ToolResult] | None,
 ) -> dict[str, Any]:
-    calls: dict[str, Any] = {}
-    if results:
-        for result in results:
-            calls[result.tool_call_id] = ToolReturn(
-                return_value=result.error or result.output or "",
-            )
-    return calls
+    return {r.tool_call_id: ToolReturn(return_value=r.error or r.output or "") for r in results or ()}
 
 
 def _fill_uncovered(
@@ -161,12 +166,10 @@ def _fill_uncovered(
     """Auto-deny/fail deferred tools not covered by user feedback."""
     for tool_call_id, meta in metadata.items():
         tool_type = meta.get("type", "approval")
-        if tool_type == "approval" and tool_call_id not in approvals:
-            approvals[tool_call_id] = ToolDenied(message="Auto-denied: no response provided")
-        elif tool_type == "call" and tool_call_id not in calls:
-            calls[tool_call_id] = ToolReturn(
-                return_value="Auto-failed: no result provided",
-            )
+        if tool_type == "approval":
+            approvals.setdefault(tool_call_id, _AUTO_DENIED)
+        elif tool_type == "call":
+            calls.setdefault(tool_call_id, _AUTO_FAILED)
 
 
 # ---------------------------------------------------------------------------
@@ -174,6 +177,66 @@ def _fill_uncovered(
 # ---------------------------------------------------------------------------
 
 
+_JSON_LEAF_TYPES: frozenset[object] = frozenset({str, int, float, bool, type(None), Any})
+
+
+def _is_json_native(tp: object) -> bool:
+    """True if *tp* only describes plain JSON values (no models to build)."""
+    if tp in _JSON_LEAF_TYPES:
+        return True
+    origin = get_origin(tp)
+    if origin in (dict, list, Union, UnionType):
+        return all(_is_json_native(arg) for arg in get_args(tp))
+    return False
+
+
+@cache
+def _field_converter(tp: Any) -> Callable[[Any], Any] | None:
+    """How to turn a stored value back into *tp* (``None`` = use as-is)."""
+    if _is_json_native(tp):
+        return None
+    if isinstance(tp, type) and issubclass(tp, BaseModel) and _constructible(tp):
+        return partial(_trusted_construct, tp)
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is dict and _is_json_native(args[0]) and (inner := _field_converter(args[1])) is not None:
+        return lambda value: {k: inner(v) for k, v in value.items()}
+    if origin is list and (inner := _field_converter(args[0])) is not None:
+        return lambda value: [inner(v) for v in value]
+    return TypeAdapter(tp).validate_python
+
+
+@cache
+def _constructible(cls: type[BaseModel]) -> bool:
+    """Whether *cls* can be rebuilt without running any custom validation."""
+    decorators = cls.__pydantic_decorators__
+    return not (
+        decorators.field_validators
+        or decorators.model_validators
+        or any(f.metadata or f.validation_alias for f in cls.model_fields.values())
+    )
+
+
+def _trusted_construct[M: BaseModel](cls: type[M], data: dict[str, Any]) -> M:
+    """Rebuild *cls* from a dict produced by our own ``model_dump``.
+
+    Only safe for data written by :func:`_export_session_state`: plain JSON
+    fields are adopted as-is via ``model_construct``, nested models are
+    constructed recursively, and only fields holding foreign types
+    (dataclasses, discriminated unions) go through Pydantic validation.
+    Falls back to ``model_validate`` for models with custom validators.
+    """
+    if not _constructible(cls):
+        return cls.model_validate(data)
+    values: dict[str, Any] = {}
+    for name, field in cls.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        converter = _field_converter(field.annotation)
+        values[name] = value if converter is None or value is None else converter(value)
+    return cls.model_construct(**values)
+
+
 def _restore_parent_state(
     parent_state: SessionState | None,
 ) -> tuple[ResumableState | None, Any]:
@@ -185,12 +248,10 @@ def _restore_parent_state(
     resource_state = None
 
     if parent_state.context_state:
-        resumable_state = ResumableState.model_validate(parent_state.context_state)
+        resumable_state = _trusted_construct(ResumableState, parent_state.context_state)
 
     if parent_state.environment_state:
-        from y_agent_environment.resources import ResourceRegistryState
-
-        resource_state = ResourceRegistryState.model_validate(parent_state.environment_state)
+        resource_state = _trusted_construct(ResourceRegistryState, parent_state.environment_state)
 
     return resumable_state, resource_state
 
@@ -212,9 +273,8 @@ def _get_output(streamer: AgentStreamer) -> object | None:
         return result.output if result is not None else None
 
 
-def _extract_final_message(streamer: AgentStreamer) -> str | None:
-    """Extract the final text output from the agent run."""
-    output = _get_output(streamer)
+def _extract_final_message(output: object | None) -> str | None:
+    """Extract the final text from a run output (see ``_get_output``)."""
     if output is None or isinstance(output, DeferredToolRequests):
         return None
     if isinstance(output, str):
@@ -222,9 +282,9 @@ def _extract_final_message(streamer: AgentStreamer) -> str | None:
     return str(output)
 
 
-def _check_deferred(streamer: AgentStreamer) -> bool:
-    """Check if the run produced deferred tool requests."""
-    return isinstance(_get_output(streamer), DeferredToolRequests)
+def _check_deferred(output: object | None) -> TypeIs[DeferredToolRequests]:
+    """Check if a run output is a set of deferred tool requests."""
+    return isinstance(output, DeferredToolRequests)
 
 
 def _serialize_deferred_tools(deferred: DeferredToolRequests) -> dict:
@@ -247,6 +307,26 @@ def _serialize_deferred_tools(deferred: DeferredToolRequests) -> dict:
     }
 
 
+# Bound once: every session dumps the same ``list[ModelMessage]`` schema, so
+# go straight to the shared pydantic-core serializer.
+_MESSAGES_SERIALIZER = ModelMessagesTypeAdapter.serializer
+
+
+def _serialize_messages(messages: list[ModelMessage]) -> list:
+    """Dump a message history to JSON-native values."""
+    return _MESSAGES_SERIALIZER.to_python(messages, mode="json") if messages else []
+
+
+async def _export_environment_state(runtime: AgentRuntime) -> dict:
+    """Export the environment resource snapshot (ResourceRegistryState -> dict)."""
+    try:
+        env_state = await runtime.env.export_resource_state()
+    except Exception:
+        logger.debug("Could not export environment state", exc_info=True)
+        return {}
+    return env_state.model_dump(mode="json") if env_state else {}
+
+
 async def _export_session_state(
     runtime: AgentRuntime,
     streamer: AgentStreamer,
@@ -256,23 +336,34 @@ async def _export_session_state(
     Must be called while the runtime is still alive (inside the
     ``stream_agent`` context manager).
     """
-    # Context state (ResumableState -> dict)
-    context_state = runtime.ctx.export_state()
+    # All three parts are dumped straight to JSON-native values by
+    # pydantic-core, so the stores only have to encode plain dicts/lists
+    # (no second pass over datetimes, bytes, etc.).  They stay dicts rather
+    # than JSON bytes so SessionState has one shape whether it was exported
+    # here or read back from a store.
 
-    # Message history (ModelMessage list -> JSON-serializable dicts)
-    messages = streamer.run.all_messages() if streamer.run else []
-    serialized_messages = ModelMessagesTypeAdapter.dump_python(messages, mode="json") if messages else []
+    # Environment export may do I/O (e.g. querying a sandbox); start it first
+    # so it overlaps with the CPU-bound dumps below.
+    env_task = asyncio.create_task(_export_environment_state(runtime))
 
-    # Environment state (ResourceRegistryState -> dict)
     try:
-        env_state = await runtime.env.export_resource_state()
-        env_dict = env_state.model_dump() if env_state else {}
-    except Exception:
-        logger.debug("Could not export environment state", exc_info=True)
-        env_dict = {}
-
-    return SessionState(
-        context_state=context_state.model_dump(),
+        # Context state (ResumableState -> dict)
+        context_state = runtime.ctx.export_state().model_dump(mode="json")
+
+        # Message history (ModelMessage list -> JSON-serializable dicts).  Done
+        # in a worker thread so the loop keeps driving the environment export.
+        messages = streamer.run.all_messages() if streamer.run else []
+        serialized_messages = await asyncio.to_thread(_serialize_messages, messages) if messages else []
+    except BaseException:
+        env_task.cancel()
+        raise
+
+    env_dict = await env_task
+
+    # Built from our own serializer output: skip re-validating (and copying)
+    # the potentially large history.
+    return SessionState.model_construct(
+        context_state=context_state,
         message_history=serialized_messages,
         environment_state=env_dict,
     )
@@ -304,10 +395,14 @@ def _build_pipeline_usage(
 
 
 def _pipeline_usage_to_summary(usage: PipelineUsage) -> UsageSummary:
-    """Convert dataclass ``PipelineUsage`` to Pydantic ``UsageSummary`` for PG storage."""
-    return UsageSummary(
+    """Convert dataclass ``PipelineUsage`` to Pydantic ``UsageSummary`` for PG storage.
+
+    The counters come from our own dataclasses, so validation is skipped.
+    """
+    return UsageSummary.model_construct(
         model_usages={
-            model_id: ModelUsageSummary(**asdict(model_usage)) for model_id, model_usage in usage.model_usages.items()
+            model_id: ModelUsageSummary.model_construct(**asdict(model_usage))
+            for model_id, model_usage in usage.model_usages.items()
         }
     )
 
@@ -324,7 +419,7 @@ def _build_run_summary(
     dataclass ``PipelineUsage`` (for the ``PipelineCompleted`` event).
     """
     pipeline_usage = _build_pipeline_usage(runtime, streamer, model_id)
-    summary = RunSummary(
+    summary = RunSummary.model_construct(
         duration_ms=duration_ms,
         usage=_pipeline_usage_to_summary(pipeline_usage),
     )
@@ -436,6 +531,72 @@ async def _deliver(
             )
 
 
+# Upper bound on SDK events buffered between the stream loop and delivery.
+_EVENT_QUEUE_SIZE = 1024
+
+
+class _EventPump:
+    """Deliver SDK stream events to the transport from a dedicated task.
+
+    The stream loop only enqueues; a single dispatcher task drains whatever
+    has accumulated and runs it through the adapter in order.  Transport
+    round-trips (e.g. an un-batched XADD) therefore overlap with the model
+    stream instead of stalling it, and the producer only waits when the
+    bounded queue is full.
+
+    A delivery failure stops the run: it is stored and raised from the next
+    ``put`` so the producer stops streaming instead of events being dropped.
+    """
+
+    def __init__(self, adapter: ProtocolAdapter, transport: EventTransport) -> None:
+        self._adapter = adapter
+        self._transport = transport
+        self._queue: asyncio.Queue[StreamEvent | None] = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        self._error: Exception | None = None
+        self._task = asyncio.create_task(self._run())
+
+    async def put(self, event: StreamEvent) -> None:
+        """Queue an event; waits only when the queue is full.
+
+        Raises the delivery error once one has occurred.
+        """
+        if self._error is not None:
+            raise self._error
+        await self._queue.put(event)
+
+    async def drain(self, *, reraise: bool = True) -> None:
+        """Deliver everything queued so far and stop the dispatcher.
+
+        With ``reraise=False`` a delivery error is logged instead of raised,
+        for callers that already have an exception propagating.
+        """
+        await self._queue.put(None)
+        try:
+            await self._task
+        except Exception:
+            if reraise:
+                raise
+            logger.debug("Event delivery failed while the stream was already failing", exc_info=True)
+
+    async def _run(self) -> None:
+        # After a failure keep consuming (and discarding) so a producer
+        # blocked on a full queue wakes up and sees the error in put().
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for event in batch:
+                if event is None:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                if self._error is None:
+                    try:
+                        await _deliver(self._adapter.on_event(event), self._transport)
+                    except Exception as exc:
+                        self._error = exc
+
+
 # ---------------------------------------------------------------------------
 # Mailbox posting helper
 # ---------------------------------------------------------------------------
@@ -583,7 +744,7 @@ async def execute_session(  # noqa: C901
     ExecutionResult
         Outcome of the execution (status, final_message, summary).
     """
-    start_time = time.monotonic()
+    start_ns = time.monotonic_ns()
 
     # -- Protocol adapter (default: AG-UI) -------------------------------------
     adapter = protocol_adapter or AGUIProtocol()
@@ -601,11 +762,6 @@ async def execute_session(  # noqa: C901
     async_subagent_registry: dict[str, str] = {}
 
     if config.subagents.async_enabled and config.subagents.refs and session_factory is not None:
-        from netherbrain.agent_runtime.execution.delegate import (
-            DelegateContext,
-            create_spawn_delegate_tool,
-        )
-
         delegate_ctx = DelegateContext(
             session_id=session_id,
             conversation_id=conversation_id,
@@ -631,6 +787,10 @@ async def execute_session(  # noqa: C901
         else:
             extra_agent_tools.append(meta_tool)
 
+    # Create project directories off the event loop; the synchronous check
+    # inside create_environment then finds them in place.
+    await resolve_project_paths(config, settings).ensure_directories_async()
+
     runtime, _paths = create_service_runtime(
         config,
         settings,
@@ -691,7 +851,7 @@ async def execute_session(  # noqa: C901
     exported_final: str | None = None
     exported_summary: RunSummary | None = None
     exported_pipeline_usage: PipelineUsage | None = None
-    is_deferred = False
+    deferred_req: DeferredToolRequests | None = None
     _session_type_str = "async_subagent" if subagent_name else "agent"
 
     try:
@@ -727,13 +887,26 @@ async def execute_session(  # noqa: C901
 
             # -- Stream SDK events through protocol adapter ------------
             # UsageSnapshot events arrive here via output_queue injection.
-            async for event in streamer:
-                if event_transport:
-                    await _deliver(adapter.on_event(event), event_transport)
+            if event_transport:
+                pump = _EventPump(adapter, event_transport)
+                # The adapter buffer must be complete before export and
+                # before any terminal event is emitted.
+                try:
+                    async for event in streamer:
+                        await pump.put(event)
+                except BaseException:
+                    # Keep the in-flight exception; a delivery error is secondary.
+                    await pump.drain(reraise=False)
+                    raise
+                await pump.drain()
+            else:
+                async for _event in streamer:
+                    pass
 
             # Still inside stream_agent context -- runtime is alive.
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            exported_final = _extract_final_message(streamer)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            output = _get_output(streamer)
+            exported_final = _extract_final_message(output)
             exported_summary, exported_pipeline_usage = _build_run_summary(
                 runtime,
                 streamer,
@@ -741,21 +914,16 @@ async def execute_session(  # noqa: C901
                 duration_ms,
             )
             exported_state = await _export_session_state(runtime, streamer)
-            is_deferred = _check_deferred(streamer)
+            if _check_deferred(output):
+                deferred_req = output
 
         # Normal completion (no exception from __aexit__).
-        status = SessionStatus.AWAITING_TOOL_RESULTS if is_deferred else SessionStatus.COMMITTED
+        status = SessionStatus.AWAITING_TOOL_RESULTS if deferred_req is not None else SessionStatus.COMMITTED
 
         assert exported_state is not None  # noqa: S101
 
         # Serialize deferred tools for display (if HITL pending).
-        deferred_tools_data: dict | None = None
-        deferred_req: DeferredToolRequests | None = None
-        if is_deferred:
-            output = _get_output(streamer)
-            if isinstance(output, DeferredToolRequests):
-                deferred_req = output
-                deferred_tools_data = _serialize_deferred_tools(output)
+        deferred_tools_data = _serialize_deferred_tools(deferred_req) if deferred_req is not None else None
 
         await session_manager.commit_session(
             db,
@@ -768,29 +936,14 @@ async def execute_session(  # noqa: C901
             status=status,
         )
 
-        # -- Post mailbox message if async subagent ----------------------------
-        await _post_mailbox_if_subagent(
-            db,
-            subagent_name=subagent_name,
-            session_id=session_id,
-            conversation_id=conversation_id,
-            status=status,
-            redis=redis,
-        )
+        # -- Post-commit side effects ------------------------------------------
+        # The mailbox entry goes first: a client reacting to the terminal
+        # event must already find it.  The notification (Pub/Sub) is
+        # independent of the terminal event, so those two run concurrently.
 
-        # -- Publish session_completed notification ----------------------------
-        await publish_notification(
-            redis,
-            SessionCompleted(
-                conversation_id=conversation_id,
-                session_id=session_id,
-                session_type=_session_type_str,
-                final_message_preview=exported_final[:200] if exported_final else None,
-            ),
-        )
-
-        # -- Emit PipelineCompleted (flows through adapter.on_event) -----------
-        if event_transport:
+        async def _emit_completed() -> None:
+            if event_transport is None:
+                return
             completed = _wrap_pipeline_event(
                 PipelineCompleted(
                     event_id=session_id,
@@ -802,6 +955,27 @@ async def execute_session(  # noqa: C901
             await _deliver(adapter.on_event(completed), event_transport)
             await event_transport.close()
 
+        await _post_mailbox_if_subagent(
+            db,
+            subagent_name=subagent_name,
+            session_id=session_id,
+            conversation_id=conversation_id,
+            status=status,
+            redis=redis,
+        )
+        await asyncio.gather(
+            publish_notification(
+                redis,
+                SessionCompleted(
+                    conversation_id=conversation_id,
+                    session_id=session_id,
+                    session_type=_session_type_str,
+                    final_message_preview=exported_final[:200] if exported_final else None,
+                ),
+            ),
+            _emit_completed(),
+        )
+
         logger.info(
             "Session %s completed: status=%s, duration=%dms",
             session_id,
@@ -818,7 +992,7 @@ async def execute_session(  # noqa: C901
         )
 
     except AgentInterrupted:
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
         summary = exported_summary or RunSummary(duration_ms=duration_ms)
 
         # -- Emit run_error (interrupted) --------------------------------------
@@ -871,7 +1045,7 @@ async def execute_session(  # noqa: C901
 
     except Exception:
         logger.exception("Session %s failed", session_id)
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
         await session_manager.fail_session(db, session_id)
 
         # -- Post mailbox message if async subagent ----------------------------
@@ -17,6 +17,7 @@ config resolution, and session lifecycle management.
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -147,7 +148,9 @@ def create_spawn_delegate_tool(delegate_ctx: DelegateContext) -> Tool:
             return f"Error: failed to launch subagent: {exc}"
 
         # Update registry so subsequent dispatches of the same name can resume.
-        dc.async_subagent_registry[name] = result.session_id
+        # Names come from model output (a fresh string per call); intern so
+        # every registry shares one key object per subagent name.
+        dc.async_subagent_registry[sys.intern(name)] = result.session_id
 
         logger.info(
             "Dispatched async subagent '%s': session=%s, conversation=%s",
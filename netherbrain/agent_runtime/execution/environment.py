@@ -29,6 +29,9 @@ Three environment modes are supported:
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -109,6 +112,10 @@ class ProjectPaths:
 
     Constructed from ``ResolvedConfig.project_ids`` and settings.
     Used by the environment factory to configure FileOperator and Shell.
+
+    Paths are computed once at construction and derived views are cached.
+    Instances are immutable and shared between sessions with the same
+    layout (see ``resolve_project_paths``).
     """
 
     def __init__(
@@ -116,11 +123,11 @@ class ProjectPaths:
         *,
         data_root: Path,
         prefix: str | None,
-        project_ids: list[str],
+        project_ids: Sequence[str],
         virtual_root: Path | None = None,
     ) -> None:
         self.virtual_root = virtual_root or Path(DEFAULT_CONTAINER_WORKDIR)
-        self.project_ids = project_ids
+        self.project_ids: tuple[str, ...] = tuple(project_ids)
 
         # Build real base: {data_root}/{prefix}/projects/ or {data_root}/projects/
         base = data_root
@@ -128,6 +135,9 @@ class ProjectPaths:
             base = base / prefix
         self._projects_base = base / "projects"
 
+        self._real_paths = {pid: self._projects_base / pid for pid in project_ids}
+        self._virtual_paths = {pid: self.virtual_root / pid for pid in project_ids}
+
     @property
     def has_projects(self) -> bool:
         return len(self.project_ids) > 0
@@ -137,66 +147,100 @@ class ProjectPaths:
         """First project_id is the default (CWD)."""
         return self.project_ids[0] if self.project_ids else None
 
-    @property
+    @cached_property
     def extra_project_ids(self) -> list[str]:
         """Additional project_ids beyond the default."""
-        return self.project_ids[1:] if len(self.project_ids) > 1 else []
+        return list(self.project_ids[1:])
 
     def real_path(self, project_id: str) -> Path:
         """Real host path for a project: ``{base}/projects/{project_id}/``."""
-        return self._projects_base / project_id
+        path = self._real_paths.get(project_id)
+        return path if path is not None else self._projects_base / project_id
 
     def virtual_path(self, project_id: str) -> Path:
         """Virtual path for a project: ``{virtual_root}/{project_id}/``."""
-        return self.virtual_root / project_id
+        path = self._virtual_paths.get(project_id)
+        return path if path is not None else self.virtual_root / project_id
 
-    @property
+    @cached_property
     def default_real_path(self) -> Path | None:
         """Real path for the default project (CWD)."""
         pid = self.default_project_id
         return self.real_path(pid) if pid else None
 
-    @property
+    @cached_property
     def default_virtual_path(self) -> Path | None:
         """Virtual path for the default project (CWD)."""
         pid = self.default_project_id
         return self.virtual_path(pid) if pid else None
 
-    @property
+    @cached_property
     def all_real_paths(self) -> list[Path]:
         """All real project paths in order."""
-        return [self.real_path(pid) for pid in self.project_ids]
+        return list(self._real_paths.values())
 
-    @property
+    @cached_property
     def all_virtual_paths(self) -> list[Path]:
         """All virtual project paths in order."""
-        return [self.virtual_path(pid) for pid in self.project_ids]
+        return list(self._virtual_paths.values())
 
-    @property
+    @cached_property
     def path_mapping(self) -> dict[str, Path]:
         """Virtual path string -> real Path mapping for all projects.
 
         Used by VirtualFileOperator to translate paths.
         """
-        return {str(self.virtual_path(pid)): self.real_path(pid) for pid in self.project_ids}
+        return {str(self._virtual_paths[pid]): real for pid, real in self._real_paths.items()}
+
+    def _missing_directories(self) -> list[Path]:
+        """Project directories that do not exist yet (the warm case is empty)."""
+        return [p for p in self.all_real_paths if not p.is_dir()]
 
     def ensure_directories(self) -> None:
         """Create all project directories on disk (idempotent)."""
-        for real_path in self.all_real_paths:
+        for real_path in self._missing_directories():
             real_path.mkdir(parents=True, exist_ok=True)
 
+    async def ensure_directories_async(self) -> None:
+        """Create all project directories off the event loop (idempotent).
+
+        Missing directories are created concurrently in worker threads so
+        slow storage does not serialize session setup.
+        """
+        missing = await asyncio.to_thread(self._missing_directories)
+        if missing:
+            await asyncio.gather(*(asyncio.to_thread(p.mkdir, parents=True, exist_ok=True) for p in missing))
+
 
 def resolve_project_paths(
     config: ResolvedConfig,
     settings: NetherSettings,
 ) -> ProjectPaths:
-    """Build ``ProjectPaths`` from resolved config and settings."""
-    virtual_root = Path(config.container_workdir) if config.container_workdir else None
+    """Build ``ProjectPaths`` from resolved config and settings.
+
+    Continuations of a conversation resolve the same layout every time, so
+    instances are cached per layout and shared.
+    """
+    return _cached_project_paths(
+        str(settings.data_root),
+        settings.data_prefix,
+        tuple(config.project_ids),
+        config.container_workdir,
+    )
+
+
+@lru_cache(maxsize=512)
+def _cached_project_paths(
+    data_root: str,
+    prefix: str | None,
+    project_ids: tuple[str, ...],
+    container_workdir: str | None,
+) -> ProjectPaths:
     return ProjectPaths(
-        data_root=Path(settings.data_root),
-        prefix=settings.data_prefix,
-        project_ids=config.project_ids,
-        virtual_root=virtual_root,
+        data_root=Path(data_root),
+        prefix=prefix,
+        project_ids=project_ids,
+        virtual_root=Path(container_workdir) if container_workdir else None,
     )
 
 
@@ -298,20 +342,20 @@ def _create_sandbox_environment(
     The user is responsible for mounting project directories into the
     container at the appropriate paths (matching ``container_workdir``).
     """
-    workdir = config.container_workdir or DEFAULT_CONTAINER_WORKDIR
-
-    # Build mount mappings: host project dirs -> virtual paths inside container
+    # Build mount mappings: host project dirs -> virtual paths inside container.
+    # ``paths.virtual_root`` is the container workdir, so both sides come
+    # from the mappings precomputed in ProjectPaths.
     mounts = [
         VirtualMount(
             host_path=paths.real_path(pid),
-            virtual_path=Path(workdir) / pid,
+            virtual_path=paths.virtual_path(pid),
         )
         for pid in paths.project_ids
     ]
 
     # Default working directory is the first project's virtual path
-    default_project = paths.default_project_id
-    work_dir = f"{workdir}/{default_project}" if default_project else workdir
+    default_virtual = paths.default_virtual_path
+    work_dir = str(default_virtual) if default_virtual else str(paths.virtual_root)
 
     return SandboxEnvironment(
         mounts=mounts,
@@ -29,7 +29,7 @@ MAIN_AGENT_ID = "main"
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelUsage:
     """Token usage for a single model.
 
@@ -69,7 +69,7 @@ class ModelUsage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineUsage:
     """Aggregated token usage by model_id.
 
@@ -17,11 +17,15 @@ See spec/agent_runtime/03-execution.md (Input Mapping) for the full matrix.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextlib
 import logging
 import mimetypes
-import uuid
-from pathlib import Path
+import os
+import re
+import secrets
+import threading
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -38,7 +42,7 @@ from netherbrain.agent_runtime.models.enums import InputPartType, StorageMode
 from netherbrain.agent_runtime.models.input import InputPart
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
 
     import httpx
     from y_agent_environment import FileOperator
@@ -52,15 +56,22 @@ logger = logging.getLogger(__name__)
 _MAX_DOWNLOAD_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB -- saved to disk (tmp)
 _MAX_INLINE_BYTES = 50 * 1024 * 1024  # 50 MB -- loaded into model context
 _ALLOWED_URL_SCHEMES = frozenset({"http", "https"})
+_DOWNLOAD_CHUNK_BYTES = 256 * 1024  # read/write granularity for URL downloads
+_THREADED_DECODE_CHARS = 256 * 1024  # base64 payloads above this decode in a worker thread
+_LEADING_SEPARATORS = re.compile(r"^(?:\.?/)+")  # any run of leading "/" and "./"
 
 
 # ---------------------------------------------------------------------------
 # MIME classification
 # ---------------------------------------------------------------------------
 
-_IMAGE_PREFIXES = ("image/",)
-_AUDIO_PREFIXES = ("audio/",)
-_VIDEO_PREFIXES = ("video/",)
+# Top-level MIME type -> content category.
+_TOP_LEVEL_CATEGORIES = {
+    "image": "image",
+    "audio": "audio",
+    "video": "video",
+    "text": "document",
+}
 _DOCUMENT_TYPES = {
     "application/pdf",
     "text/plain",
@@ -71,6 +82,66 @@ _DOCUMENT_TYPES = {
 }
 
 
+# The types input mapping actually deals with; ``mimetypes`` (which loads
+# and parses the system MIME tables on first use) is only consulted on a miss.
+_EXT_TO_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".bmp": "image/bmp",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/x-wav",
+    ".ogg": "audio/ogg",
+    ".flac": "audio/flac",
+    ".m4a": "audio/mp4",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+    ".mov": "video/quicktime",
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".csv": "text/csv",
+    ".json": "application/json",
+}
+_MIME_TO_EXT = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/svg+xml": ".svg",
+    "audio/mpeg": ".mp3",
+    "audio/wav": ".wav",
+    "audio/x-wav": ".wav",
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+    "application/pdf": ".pdf",
+    "text/plain": ".txt",
+    "text/markdown": ".md",
+    "text/html": ".html",
+    "text/csv": ".csv",
+    "application/json": ".json",
+    "application/octet-stream": ".bin",
+}
+
+
+def _guess_mime(path: str) -> str | None:
+    """Guess a MIME type from a file path or URL (query/fragment ignored)."""
+    bare = path.split("?", 1)[0].split("#", 1)[0]
+    mime = _EXT_TO_MIME.get(os.path.splitext(bare)[1].lower())
+    return mime if mime is not None else mimetypes.guess_type(path)[0]
+
+
+def _guess_extension(mime: str) -> str | None:
+    """Guess a file extension (with dot) for a MIME type."""
+    ext = _MIME_TO_EXT.get(mime)
+    return ext if ext is not None else mimetypes.guess_extension(mime)
+
+
 def _classify_mime(mime: str | None) -> str:
     """Classify MIME type into a content category.
 
@@ -81,13 +152,12 @@ def _classify_mime(mime: str | None) -> str:
 
     mime_lower = mime.lower().split(";")[0].strip()
 
-    if any(mime_lower.startswith(p) for p in _IMAGE_PREFIXES):
-        return "image"
-    if any(mime_lower.startswith(p) for p in _AUDIO_PREFIXES):
-        return "audio"
-    if any(mime_lower.startswith(p) for p in _VIDEO_PREFIXES):
-        return "video"
-    if mime_lower in _DOCUMENT_TYPES or mime_lower.startswith("text/"):
+    top_level, sep, _ = mime_lower.partition("/")
+    if sep:
+        category = _TOP_LEVEL_CATEGORIES.get(top_level)
+        if category is not None:
+            return category
+    if mime_lower in _DOCUMENT_TYPES:
         return "document"
     return "binary"
 
@@ -96,8 +166,7 @@ def _url_to_inline_content(url: str, mime: str | None) -> UserContent:
     """Map a URL + MIME to the appropriate pydantic-ai inline content type."""
     # Try to guess MIME from URL if not provided
     if mime is None:
-        guessed, _ = mimetypes.guess_type(url)
-        mime = guessed
+        mime = _guess_mime(url)
 
     category = _classify_mime(mime)
 
@@ -142,7 +211,8 @@ async def _download_url(
 
     Safety:
     - Only http/https schemes are allowed.
-    - Downloads are capped at ``_MAX_DOWNLOAD_BYTES`` (stream-checked).
+    - Downloads are capped at ``_MAX_DOWNLOAD_BYTES`` (stream-checked);
+      a partially written file is removed when the limit is hit.
     - The Content-Length header is checked for early rejection.
     """
     # Validate URL scheme
@@ -151,10 +221,13 @@ async def _download_url(
         msg = f"URL scheme not allowed: {parsed.scheme!r} (allowed: {', '.join(sorted(_ALLOWED_URL_SCHEMES))})"
         raise ValueError(msg)
 
-    original_name = Path(parsed.path).name or "download"
-    filename = f"{uuid.uuid4().hex[:8]}-{original_name}"
+    original_name = parsed.path.rstrip("/").rpartition("/")[2]
+    if original_name in ("", ".", ".."):
+        original_name = "download"
+    filename = f"{secrets.token_hex(4)}-{original_name}"
 
-    # Stream download with size limit
+    # Stream download straight into the target file with a size limit, so
+    # memory stays at one chunk regardless of the file size.
     async with client.stream("GET", url, follow_redirects=True) as response:
         response.raise_for_status()
 
@@ -164,26 +237,33 @@ async def _download_url(
             msg = f"File too large: {content_length} bytes (limit: {_MAX_DOWNLOAD_BYTES})"
             raise ValueError(msg)
 
-        # Stream with incremental size check
-        chunks: list[bytes] = []
         total = 0
-        async for chunk in response.aiter_bytes():
-            total += len(chunk)
-            if total > _MAX_DOWNLOAD_BYTES:
-                msg = f"Download exceeded size limit ({_MAX_DOWNLOAD_BYTES} bytes)"
-                raise ValueError(msg)
-            chunks.append(chunk)
 
-        content = b"".join(chunks)
+        async def _chunks() -> AsyncIterator[bytes]:
+            nonlocal total
+            async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                total += len(chunk)
+                if total > _MAX_DOWNLOAD_BYTES:
+                    msg = f"Download exceeded size limit ({_MAX_DOWNLOAD_BYTES} bytes)"
+                    raise ValueError(msg)
+                yield chunk
+
+        if persistent:
+            saved_ref = filename  # project-relative path
+            hint = ""
+        else:
+            # Claim the tmp path first; absolute tmp paths are routed to the
+            # tmp operator by write_bytes_stream.
+            saved_ref = await file_operator.write_tmp_file(filename, b"")
+            hint = "\nNote: This is a temporary file that will be deleted after the session. Move it to the project directory if you need to keep it."
+        try:
+            await file_operator.write_bytes_stream(saved_ref, _chunks())
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await file_operator.delete(saved_ref)
+            raise
 
     content_type = response.headers.get("content-type", "unknown")
-    if persistent:
-        await file_operator.write_file(filename, content)
-        saved_ref = filename  # project-relative path
-        hint = ""
-    else:
-        saved_ref = await file_operator.write_tmp_file(filename, content)
-        hint = "\nNote: This is a temporary file that will be deleted after the session. Move it to the project directory if you need to keep it."
     storage_label = "persistent" if persistent else "ephemeral"
     logger.debug("Downloaded %s -> %s (%s, %d bytes, %s)", url, saved_ref, content_type, total, storage_label)
 
@@ -210,8 +290,8 @@ async def _write_binary(
         msg = f"Binary data too large: {len(data)} bytes (limit: {_MAX_DOWNLOAD_BYTES})"
         raise ValueError(msg)
 
-    ext = mimetypes.guess_extension(mime) or ".bin"
-    filename = f"{uuid.uuid4().hex[:12]}{ext}"
+    ext = _guess_extension(mime) or ".bin"
+    filename = f"{secrets.token_hex(6)}{ext}"
 
     if persistent:
         await file_operator.write_file(filename, data)
@@ -232,7 +312,75 @@ def _resolve_file_path(path: str) -> str:
     relative path.  Path containment is enforced by FileOperator when
     the agent later accesses the file.
     """
-    return path.lstrip("/").lstrip("./")
+    return _LEADING_SEPARATORS.sub("", path)
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+
+
+class _SharedHttpClient:
+    """Lazily created HTTP client reused by every input mapping.
+
+    Keeps TLS sessions and keep-alive sockets across prompts.  A client is
+    bound to the event loop it was created on, so a new one is made if the
+    running loop changes; the stale client is closed on its own loop (see
+    ``_close_on_loop``).
+    """
+
+    __slots__ = ("_client", "_loop")
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            import httpx
+
+            if self._client is not None and not self._client.is_closed and self._loop is not None:
+                _close_on_loop(self._client, self._loop)
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+def _close_on_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a client replaced by ``_SharedHttpClient.get`` on its own loop.
+
+    Its pooled sockets belong to *loop*, so ``aclose`` must run there: it is
+    scheduled if the loop is running in another thread, or run to completion
+    in a helper thread if the loop is merely stopped.  A closed loop cannot
+    run anything any more; its sockets are only released when the client is
+    garbage collected.
+    """
+    if loop.is_closed():
+        logger.debug("Dropping shared HTTP client of a closed event loop")
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        closer = threading.Thread(target=loop.run_until_complete, args=(client.aclose(),), name="http-client-close")
+        closer.start()
+        closer.join()
+
+
+_shared_http = _SharedHttpClient()
+
+
+async def close_http_client() -> None:
+    """Close the shared download client (called on app shutdown)."""
+    await _shared_http.aclose()
 
 
 # ---------------------------------------------------------------------------
@@ -257,8 +405,8 @@ async def map_input_to_prompt(
         and ``storage=persistent`` operations on url/binary parts, and
         ``storage=inline`` on file parts.
     http_client:
-        HTTP client for downloading URLs.  A temporary client is created
-        if not provided.
+        HTTP client for downloading URLs.  The shared module client is
+        used if not provided.
 
     Returns
     -------
@@ -278,48 +426,41 @@ async def map_input_to_prompt(
     if len(parts) == 1 and parts[0].type == InputPartType.TEXT:
         return parts[0].text or ""
 
-    # Check if all parts are text -> can return simple concatenated string
-    all_text = all(p.type == InputPartType.TEXT for p in parts)
-    if all_text:
-        return "\n\n".join(p.text or "" for p in parts)
+    # All parts text -> simple concatenated string.  Collect while scanning so
+    # the mixed case bails out at the first non-text part.
+    texts: list[str] = []
+    for p in parts:
+        if p.type != InputPartType.TEXT:
+            break
+        texts.append(p.text or "")
+    else:
+        return "\n\n".join(texts)
 
-    # Mixed content -> build a list of UserContent
-    result: list[UserContent] = []
-    own_client = False
+    # Mixed content -> map every part concurrently (downloads, file reads and
+    # writes overlap); gather preserves the input order.
+    if http_client is None and file_operator is not None and any(_downloads(p) for p in parts):
+        http_client = _shared_http.get()
 
+    tasks = [asyncio.ensure_future(_map_single_part(part, file_operator, http_client)) for part in parts]
     try:
-        for part in parts:
-            content = await _map_single_part(part, file_operator, http_client)
-
-            # If we need an HTTP client and don't have one, create one
-            if content is _NEEDS_HTTP_CLIENT:
-                if http_client is None:
-                    import httpx
-
-                    http_client = httpx.AsyncClient(timeout=30.0)
-                    own_client = True
-                content = await _map_single_part(part, file_operator, http_client)
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Don't leave sibling downloads running after the caller gave up.
+        for task in tasks:
+            task.cancel()
+        raise
 
-            if isinstance(content, str):
-                result.append(content)
-            else:
-                result.append(content)  # type: ignore[arg-type]
-    finally:
-        if own_client and http_client is not None:
-            await http_client.aclose()
 
-    return result
-
-
-# Sentinel for lazy HTTP client creation
-_NEEDS_HTTP_CLIENT = object()
+def _downloads(part: InputPart) -> bool:
+    """Whether mapping *part* downloads a URL (needs an HTTP client)."""
+    return part.type == InputPartType.URL and part.storage != StorageMode.INLINE
 
 
 async def _map_url_part(
     part: InputPart,
     file_operator: FileOperator | None,
     http_client: httpx.AsyncClient | None,
-) -> UserContent | object:
+) -> UserContent:
     """Map a URL InputPart, with download fallback to inline on failure."""
     url = part.url or ""
     if part.storage == StorageMode.INLINE:
@@ -329,7 +470,8 @@ async def _map_url_part(
         logger.debug("No file operator for URL download, falling back to inline: %s", url)
         return _url_to_inline_content(url, part.mime)
     if http_client is None:
-        return _NEEDS_HTTP_CLIENT
+        logger.debug("No HTTP client for URL download, falling back to inline: %s", url)
+        return _url_to_inline_content(url, part.mime)
     try:
         return await _download_url(
             url,
@@ -346,12 +488,8 @@ async def _map_single_part(
     part: InputPart,
     file_operator: FileOperator | None,
     http_client: httpx.AsyncClient | None,
-) -> UserContent | object:
-    """Map a single InputPart to a UserContent item.
-
-    Returns ``_NEEDS_HTTP_CLIENT`` sentinel if an HTTP client is needed
-    but not available.
-    """
+) -> UserContent:
+    """Map a single InputPart to a UserContent item."""
     match part.type:
         case InputPartType.TEXT:
             return part.text or ""
@@ -388,7 +526,7 @@ async def _map_file_inline(
 
     Raises ``ValueError`` if the file exceeds ``_MAX_INLINE_BYTES``.
     """
-    clean = file_path.lstrip("/").lstrip("./")
+    clean = _resolve_file_path(file_path)
     if not await file_operator.exists(clean):
         msg = f"File not found: {file_path}"
         raise FileNotFoundError(msg)
@@ -396,16 +534,26 @@ async def _map_file_inline(
     if len(file_data) > _MAX_INLINE_BYTES:
         msg = f"File too large for inline mode: {len(file_data)} bytes (limit: {_MAX_INLINE_BYTES})"
         raise ValueError(msg)
-    resolved_mime = mime or mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    resolved_mime = mime or _guess_mime(file_path) or "application/octet-stream"
     return _bytes_to_inline_content(file_data, resolved_mime)
 
 
+async def _decode_base64(data: str) -> bytes:
+    """Decode base64, offloading large payloads so sibling parts keep moving.
+
+    Small payloads decode inline; the thread hop would cost more than it saves.
+    """
+    if len(data) < _THREADED_DECODE_CHARS:
+        return base64.b64decode(data, validate=True)
+    return await asyncio.to_thread(base64.b64decode, data, validate=True)
+
+
 async def _map_binary_part(
     part: InputPart,
     file_operator: FileOperator | None,
 ) -> UserContent | str:
     """Map a binary InputPart to either inline content or a file reference."""
-    raw = base64.b64decode(part.data or "", validate=True)
+    raw = await _decode_base64(part.data or "")
     mime = part.mime or "application/octet-stream"
     if part.storage == StorageMode.INLINE:
         if len(raw) > _MAX_INLINE_BYTES:
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from netherbrain.agent_runtime.models.session import SessionState
     from netherbrain.agent_runtime.registry import SessionRegistry
     from netherbrain.agent_runtime.settings import NetherSettings
+    from netherbrain.agent_runtime.transport.redis_batcher import RedisStreamBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,7 @@ async def launch_session(
     subagent_name: str | None = None,
     external_tools: Sequence[ExternalToolSpec] | None = None,
     execution_manager: ExecutionManager | None = None,
+    stream_batcher: RedisStreamBatcher | None = None,
 ) -> LaunchResult:
     """Create a session, set up transport, and launch execution in background.
 
@@ -107,6 +109,8 @@ async def launch_session(
         Service settings.
     redis:
         Redis client (required for stream transport).
+    stream_batcher:
+        Shared XADD pipeliner for stream transport (optional).
     config:
         Fully resolved execution config.
     input_parts:
@@ -170,7 +174,7 @@ async def launch_session(
         event_transport = sse_transport
     else:
         assert redis is not None  # noqa: S101
-        redis_transport = RedisStreamTransport(redis, session_id)
+        redis_transport = RedisStreamTransport(redis, session_id, batcher=stream_batcher)
         event_transport = redis_transport
         stream_key = redis_transport.key
 
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from netherbrain.agent_runtime.models.enums import MailboxSourceType
 
 
-@dataclass
+@dataclass(slots=True)
 class MailboxMessageWithContent:
     """A mailbox message enriched with the source session's output."""
 
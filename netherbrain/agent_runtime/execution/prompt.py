@@ -23,7 +23,10 @@ Example template::
 
 from __future__ import annotations
 
+import re
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 
 import jinja2
 
@@ -50,23 +53,57 @@ def render_system_prompt(
         The rendered system prompt.  If the template contains no Jinja2
         syntax, the original string is returned unchanged.
     """
+    # Fast path: skip Jinja2 if no template syntax detected
+    raw = config.system_prompt
+    if _TEMPLATE_SYNTAX.search(raw) is None:
+        return raw
+
     template_vars: dict[str, object] = {
         "project_ids": config.project_ids,
         "default_project": config.project_ids[0] if config.project_ids else None,
         "environment_mode": config.environment_mode.value,
         "model_name": config.model.name,
         "preset_id": config.preset_id,
-        "date": datetime.now(tz=UTC).strftime("%Y-%m-%d"),
+        "date": _utc_date.get(),
     }
 
     if extra_vars:
         template_vars.update(extra_vars)
 
-    # Fast path: skip Jinja2 if no template syntax detected
-    raw = config.system_prompt
-    if "{{" not in raw and "{%" not in raw:
-        return raw
+    return _compile(raw).render(**template_vars)
+
+
+_SECONDS_PER_DAY = 86_400
+
+
+class _UtcDate:
+    """Current UTC date as ``YYYY-MM-DD``, reformatted once per day."""
+
+    __slots__ = ("_text", "_until")
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._until = 0.0
+
+    def get(self) -> str:
+        now = time.time()
+        if now >= self._until:
+            self._text = datetime.fromtimestamp(now, tz=UTC).strftime("%Y-%m-%d")
+            # POSIX days are exactly 86400s, so this is the next UTC midnight.
+            self._until = (now // _SECONDS_PER_DAY + 1) * _SECONDS_PER_DAY
+        return self._text
+
+
+_utc_date = _UtcDate()
+
+# One scan for ``{{`` or ``{%`` (re jumps between ``{`` with memchr).
+_TEMPLATE_SYNTAX = re.compile(r"\{[{%]")
+
+# Preset prompts rarely change, so one environment and the compiled
+# templates are shared across sessions.
+_ENV = jinja2.Environment(autoescape=False)  # noqa: S701
+
 
-    env = jinja2.Environment(autoescape=False)  # noqa: S701
-    template = env.from_string(raw)
-    return template.render(**template_vars)
+@lru_cache(maxsize=256)
+def _compile(source: str) -> jinja2.Template:
+    return _ENV.from_string(source)
@@ -27,6 +27,7 @@ from sqlalchemy import select
 from netherbrain.agent_runtime.db.tables import Preset as PresetRow
 from netherbrain.agent_runtime.db.tables import Workspace as WorkspaceRow
 from netherbrain.agent_runtime.execution.mcp import McpConfig, build_mcp_config
+from netherbrain.agent_runtime.managers.presets import cache_preset, get_cached_preset
 from netherbrain.agent_runtime.models.enums import EnvironmentMode
 from netherbrain.agent_runtime.models.preset import (
     EnvironmentSpec,
@@ -87,6 +88,10 @@ class ConfigOverride(BaseModel):
     mcp_servers: list[McpServerSpec] | None = None
 
 
+_NO_OVERRIDE = ConfigOverride()
+"""Stand-in for a missing override: every field unset."""
+
+
 class ResolvedConfig(BaseModel):
     """Fully resolved configuration for the execution pipeline.
 
@@ -176,26 +181,19 @@ async def resolve_config(
     preset = await _load_preset(db, preset_id)
 
     # -- 2. Merge overrides ----------------------------------------------------
-    model = _first(override and override.model, ModelPreset(**preset.model))
-    system_prompt = _first(override and override.system_prompt, preset.system_prompt)
-    toolsets = _first(
-        override and override.toolsets,
-        [ToolsetSpec(**t) for t in preset.toolsets],
-    )
-    subagents_raw = _first(
-        override and override.subagents,
-        SubagentSpec(**preset.subagents),
-    )
-    tool_config_raw = _first(
-        override and override.tool_config,
-        ToolConfigSpec(**preset.tool_config),
-    )
+    # Preset defaults are only validated when the override leaves a field unset.
+    ov = override or _NO_OVERRIDE
+    model = ov.model if ov.model is not None else ModelPreset(**preset.model)
+    system_prompt = ov.system_prompt if ov.system_prompt is not None else preset.system_prompt
+    toolsets = ov.toolsets if ov.toolsets is not None else [ToolsetSpec(**t) for t in preset.toolsets]
+    subagents_raw = ov.subagents if ov.subagents is not None else SubagentSpec(**preset.subagents)
+    tool_config_raw = ov.tool_config if ov.tool_config is not None else ToolConfigSpec(**preset.tool_config)
 
     # Environment: merge mode/container settings from override, preset, or parent.
     # The raw preset dict is checked so we can distinguish "explicitly set to LOCAL"
     # from "not specified (default)".  Unspecified fields fall back to parent values
     # (important for async subagents inheriting the spawner's environment).
-    env_override = override.environment if override else None
+    env_override = ov.environment
     preset_env_dict = preset.environment  # raw JSONB dict
     env_preset = EnvironmentSpec(**preset_env_dict)
 
@@ -235,13 +233,14 @@ async def resolve_config(
     )
 
     # -- 4. Merge MCP servers (override replaces preset list entirely) ----------
-    mcp_servers = _first(
-        override and override.mcp_servers,
-        [McpServerSpec(**s) for s in preset.mcp_servers] if preset.mcp_servers else [],
-    )
+    if ov.mcp_servers is not None:
+        mcp_servers = ov.mcp_servers
+    else:
+        mcp_servers = [McpServerSpec(**s) for s in preset.mcp_servers] if preset.mcp_servers else []
 
     # -- 5. Build ResolvedConfig -----------------------------------------------
-    return ResolvedConfig(
+    # Every part above is already a validated model or plain value.
+    return ResolvedConfig.model_construct(
         preset_id=preset.preset_id,
         model=model,
         system_prompt=system_prompt,
@@ -265,13 +264,18 @@ async def resolve_config(
 async def _load_preset(db: AsyncSession, preset_id: str | None) -> PresetRow:
     """Load a preset by ID, or fall back to the default preset.
 
-    Raises ``NoPresetError`` if nothing is found.
+    Served from the preset cache when fresh.  Raises ``NoPresetError`` if
+    nothing is found.
     """
+    cached = get_cached_preset(preset_id)
+    if cached is not None:
+        return cached
+
     if preset_id is not None:
         row = await db.get(PresetRow, preset_id)
         if row is None:
             raise NoPresetError(preset_id)
-        return row
+        return cache_preset(preset_id, row)
 
     # Find the default preset.
     stmt = select(PresetRow).where(PresetRow.is_default.is_(True)).limit(1)
@@ -279,7 +283,7 @@ async def _load_preset(db: AsyncSession, preset_id: str | None) -> PresetRow:
     row = result.scalar_one_or_none()
     if row is None:
         raise NoPresetError()
-    return row
+    return cache_preset(None, row)
 
 
 async def _resolve_workspace(db: AsyncSession, workspace_id: str) -> tuple[list[str], dict[str, str]]:
@@ -375,11 +379,6 @@ async def _resolve_env_projects(
     return None
 
 
-def _first[T](override: T | None, default: T) -> T:
-    """Return the override if not None, otherwise the default."""
-    return override if override is not None else default
-
-
 def _resolve_env_field[T](
     override_val: T | None,
     preset_dict: dict,
@@ -13,22 +13,16 @@ The returned ``AgentRuntime`` is ready to be used with ``stream_agent()``.
 
 from __future__ import annotations
 
+import importlib
 import logging
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 from pydantic_ai import DeferredToolRequests, ModelSettings
 from ya_agent_sdk.agents.main import AgentRuntime, create_agent
-from ya_agent_sdk.context import AgentContext, ModelConfig, ResumableState, ToolConfig
+from ya_agent_sdk.context import AgentContext, ModelConfig, ResumableState, ToolConfig, ToolSettings
 from ya_agent_sdk.toolsets.core.base import BaseTool
-from ya_agent_sdk.toolsets.core.content import tools as content_tools
-from ya_agent_sdk.toolsets.core.context import tools as context_tools
-from ya_agent_sdk.toolsets.core.document import tools as document_tools
-from ya_agent_sdk.toolsets.core.enhance import tools as enhance_tools
-from ya_agent_sdk.toolsets.core.filesystem import tools as filesystem_tools
-from ya_agent_sdk.toolsets.core.multimodal import tools as multimodal_tools
-from ya_agent_sdk.toolsets.core.shell import tools as shell_tools
 from ya_agent_sdk.toolsets.core.subagent import tools as subagent_tools
-from ya_agent_sdk.toolsets.core.web import tools as web_tools
 
 from netherbrain.agent_runtime.execution.environment import ProjectPaths, create_environment
 from netherbrain.agent_runtime.execution.mcp import build_mcp_toolset
@@ -41,8 +35,6 @@ from netherbrain.agent_runtime.models.preset import (
     ToolsetSpec,
 )
 from netherbrain.agent_runtime.settings import NetherSettings
-from netherbrain.agent_runtime.toolsets.control import tools as control_tools
-from netherbrain.agent_runtime.toolsets.history import tools as history_tools
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -57,21 +49,51 @@ logger = logging.getLogger(__name__)
 # Toolset mapping
 # ---------------------------------------------------------------------------
 
+
+class _ToolsetRegistry(Mapping[str, list[type[BaseTool]]]):
+    """toolset_name -> BaseTool classes, importing each toolset on first use.
+
+    Some SDK toolsets pull in heavy optional dependencies (``web`` and
+    ``document`` together cost seconds of import time), so a module is only
+    imported once a preset -- or the toolset listing -- asks for it.
+    """
+
+    __slots__ = ("_loaded", "_modules")
+
+    def __init__(self, modules: dict[str, str]) -> None:
+        self._modules = modules
+        self._loaded: dict[str, list[type[BaseTool]]] = {}
+
+    def __getitem__(self, name: str) -> list[type[BaseTool]]:
+        tools = self._loaded.get(name)
+        if tools is None:
+            tools = importlib.import_module(self._modules[name]).tools
+            self._loaded[name] = tools
+        return tools
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
 # Maps toolset_name (from preset config) to SDK BaseTool classes.
-# Keys are the canonical names used in ToolsetSpec.toolset_name.
-TOOLSET_REGISTRY: dict[str, list[type[BaseTool]]] = {
-    "content": content_tools,
-    "context": context_tools,
-    "document": document_tools,
-    "enhance": enhance_tools,
-    "filesystem": filesystem_tools,
-    "multimodal": multimodal_tools,
-    "shell": shell_tools,
-    "web": web_tools,
-    "history": history_tools,
-    "control": control_tools,
+# Keys are the canonical names used in ToolsetSpec.toolset_name; values are
+# the modules exporting ``tools``.
+TOOLSET_REGISTRY: Mapping[str, list[type[BaseTool]]] = _ToolsetRegistry({
+    "content": "ya_agent_sdk.toolsets.core.content",
+    "context": "ya_agent_sdk.toolsets.core.context",
+    "document": "ya_agent_sdk.toolsets.core.document",
+    "enhance": "ya_agent_sdk.toolsets.core.enhance",
+    "filesystem": "ya_agent_sdk.toolsets.core.filesystem",
+    "multimodal": "ya_agent_sdk.toolsets.core.multimodal",
+    "shell": "ya_agent_sdk.toolsets.core.shell",
+    "web": "ya_agent_sdk.toolsets.core.web",
+    "history": "netherbrain.agent_runtime.toolsets.history",
+    "control": "netherbrain.agent_runtime.toolsets.control",
     # "subagent" is handled separately via SubagentSpec
-}
+})
 
 # Convenience alias: "core" enables the standard set used by yaacli.
 _CORE_TOOLSETS = [
@@ -104,7 +126,8 @@ def resolve_tools(toolsets: list[ToolsetSpec]) -> list[type[BaseTool]]:
             continue
 
         # Expand "core" alias to all standard toolsets.
-        names = _CORE_TOOLSETS if spec.toolset_name == "core" else [spec.toolset_name]
+        names = _CORE_TOOLSETS if spec.toolset_name == "core" else (spec.toolset_name,)
+        exclude_set = frozenset(spec.exclude_tools)
 
         for name in names:
             if name in seen_names:
@@ -116,10 +139,8 @@ def resolve_tools(toolsets: list[ToolsetSpec]) -> list[type[BaseTool]]:
                 logger.warning("Unknown toolset '%s', skipping", name)
                 continue
 
-            if spec.exclude_tools:
-                exclude_set = set(spec.exclude_tools)
-                filtered = [t for t in registry_tools if t.__name__ not in exclude_set]
-                tools.extend(filtered)
+            if exclude_set:
+                tools.extend(t for t in registry_tools if t.__name__ not in exclude_set)
             else:
                 tools.extend(registry_tools)
 
@@ -186,18 +207,12 @@ def resolve_tool_config(
     ``create_service_runtime`` to inject Netherbrain-specific config
     (e.g. ``nether_api_base_url``, ``nether_auth_token``).
     """
-    kwargs: dict[str, Any] = {
-        "skip_url_verification": spec.skip_url_verification,
-        "enable_load_document": spec.enable_load_document,
-    }
-    if spec.image_understanding_model is not None:
-        kwargs["image_understanding_model"] = spec.image_understanding_model
-    if spec.image_understanding_model_settings is not None:
-        kwargs["image_understanding_model_settings"] = ModelSettings(**spec.image_understanding_model_settings)
-    if spec.video_understanding_model is not None:
-        kwargs["video_understanding_model"] = spec.video_understanding_model
-    if spec.video_understanding_model_settings is not None:
-        kwargs["video_understanding_model_settings"] = ModelSettings(**spec.video_understanding_model_settings)
+    # ``ToolConfig`` fills each API key through its own ``ToolSettings()``
+    # default factory, i.e. seven env/.env reads per config.  Read the
+    # settings once and pass the keys in explicitly instead.
+    kwargs: dict[str, Any] = ToolSettings().model_dump()
+    # Unset optional fields (None) fall back to the SDK defaults.
+    kwargs.update(spec.model_dump(exclude_none=True))
     kwargs.update(extras)
     return ToolConfig(**kwargs)
 
@@ -315,7 +330,7 @@ def create_service_runtime(
     # Pure conversation mode: no projects -> strip filesystem and shell tools
     # so the agent cannot access the host filesystem or run commands.
     if not paths.has_projects:
-        _fs_shell_tools = {*filesystem_tools, *shell_tools}
+        _fs_shell_tools = {*TOOLSET_REGISTRY["filesystem"], *TOOLSET_REGISTRY["shell"]}
         tools = [t for t in tools if t not in _fs_shell_tools]
 
     # Always include subagent introspection tools.
@@ -324,8 +339,8 @@ def create_service_runtime(
     # Include history and control tools for main agent sessions (conversation_id set).
     # These tools are NOT included for subagent sessions.
     if conversation_id is not None:
-        all_tools.extend(history_tools)
-        all_tools.extend(control_tools)
+        all_tools.extend(TOOLSET_REGISTRY["history"])
+        all_tools.extend(TOOLSET_REGISTRY["control"])
 
     # -- System prompt ---------------------------------------------------------
     system_prompt = render_system_prompt(config)
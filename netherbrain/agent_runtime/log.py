@@ -11,6 +11,10 @@ import sys
 
 from loguru import logger
 
+# Frames from this file are stdlib logging internals, skipped when locating
+# the real call-site.
+_LOGGING_FILE = logging.__file__
+
 
 class _InterceptHandler(logging.Handler):
     """Bridge stdlib logging records into loguru."""
@@ -25,13 +29,23 @@ class _InterceptHandler(logging.Handler):
         # Walk the call stack so loguru reports the real call-site
         frame = logging.currentframe()
         depth = 2
-        while frame and frame.f_code.co_filename == logging.__file__:
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
+def _stdlib_level(level: str) -> int:
+    """Return the stdlib threshold for a loguru level name.
+
+    Loguru-only levels (TRACE, SUCCESS) have no stdlib counterpart, so
+    everything is forwarded and loguru does the filtering.
+    """
+    value = logging.getLevelName(level)
+    return value if isinstance(value, int) else logging.NOTSET
+
+
 def setup_logging(level: str = "INFO") -> None:
     """Configure loguru as the sole logging sink.
 
@@ -52,8 +66,10 @@ def setup_logging(level: str = "INFO") -> None:
         ),
     )
 
-    # Intercept all stdlib logging
-    logging.basicConfig(handlers=[_InterceptHandler()], level=0, force=True)
+    # Intercept all stdlib logging.  The root threshold matches the sink so
+    # records loguru would discard (e.g. sqlalchemy DEBUG) are dropped by
+    # ``isEnabledFor`` before a LogRecord is built or the stack is walked.
+    logging.basicConfig(handlers=[_InterceptHandler()], level=_stdlib_level(level), force=True)
 
     # Quiet down noisy libraries
     for name in ("uvicorn.access", "httpx", "httpcore"):
@@ -8,8 +8,7 @@ from __future__ import annotations
 
 import json
 
-from sqlalchemy import String, func, literal, select, union
-from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
+from sqlalchemy import String, func, literal, select, tuple_, union, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from netherbrain.agent_runtime.db.tables import Conversation, Session
@@ -28,15 +27,33 @@ async def list_conversations(
     metadata_contains: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    before: str | None = None,
 ) -> list[Conversation]:
     """List conversations with optional filters, newest first.
 
     When ``user_id`` is provided, only conversations owned by that user are
     returned.  Admins pass ``user_id=None`` to see all.
 
-    Raises ``ValueError`` if ``metadata_contains`` is not valid JSON.
+    ``before`` is a conversation_id cursor: only conversations older than
+    it are returned.  Paging with the last ID of the previous page costs
+    the same at any depth, unlike ``offset``.
+
+    Raises ``ValueError`` if ``metadata_contains`` is not valid JSON, and
+    ``ConversationNotFoundError`` if the ``before`` conversation is not
+    visible to ``user_id``.
     """
-    stmt = select(Conversation).order_by(Conversation.created_at.desc())
+    stmt = select(Conversation).order_by(Conversation.created_at.desc(), Conversation.conversation_id.desc())
+
+    if before is not None:
+        cursor_stmt = select(Conversation.created_at).where(Conversation.conversation_id == before)
+        if user_id is not None:
+            cursor_stmt = cursor_stmt.where(Conversation.user_id == user_id)
+        before_at = await db.scalar(cursor_stmt)
+        if before_at is None:
+            raise ConversationNotFoundError(before)
+        stmt = stmt.where(
+            tuple_(Conversation.created_at, Conversation.conversation_id) < tuple_(literal(before_at), literal(before))
+        )
 
     if user_id is not None:
         stmt = stmt.where(Conversation.user_id == user_id)
@@ -50,8 +67,9 @@ async def list_conversations(
         except json.JSONDecodeError as exc:
             msg = f"Invalid JSON in metadata_contains: {exc}"
             raise ValueError(msg) from None
-        metadata_col = Conversation.__table__.c.metadata
-        stmt = stmt.where(metadata_col.cast(PG_JSONB).contains(filter_obj))
+        # Plain ``metadata @> :filter`` on the JSONB column, so the planner
+        # can use ix_conversations_metadata (GIN, jsonb_path_ops).
+        stmt = stmt.where(Conversation.metadata_.contains(filter_obj))
 
     stmt = stmt.limit(limit).offset(offset)
     result = await db.execute(stmt)
@@ -80,20 +98,32 @@ async def get_conversation(
 
 
 async def update_conversation(db: AsyncSession, conversation_id: str, body: ConversationUpdate) -> Conversation:
-    """Update conversation fields.  Raises ``ConversationNotFoundError`` if missing."""
-    conversation = await db.get(Conversation, conversation_id)
-    if conversation is None:
-        raise ConversationNotFoundError(conversation_id)
+    """Update conversation fields.  Raises ``ConversationNotFoundError`` if missing.
 
+    Changes are written with a single ``UPDATE ... RETURNING``, which also
+    tells us whether the conversation exists.
+    """
     updates = body.model_dump(exclude_unset=True)
+    if not updates:
+        conversation = await db.get(Conversation, conversation_id)
+        if conversation is None:
+            raise ConversationNotFoundError(conversation_id)
+        return conversation
+
     if "metadata" in updates:
         updates["metadata_"] = updates.pop("metadata")
 
-    for key, value in updates.items():
-        setattr(conversation, key, value)
+    stmt = (
+        update(Conversation)
+        .where(Conversation.conversation_id == conversation_id)
+        .values(**updates)
+        .returning(Conversation)
+    )
+    conversation = (await db.execute(stmt)).scalar_one_or_none()
+    if conversation is None:
+        raise ConversationNotFoundError(conversation_id)
 
     await db.commit()
-    await db.refresh(conversation)
     return conversation
 
 
@@ -10,7 +10,8 @@ translates these to appropriate HTTP responses.
 from __future__ import annotations
 
 import contextlib
-import uuid
+import secrets
+import sys
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
@@ -59,6 +60,7 @@ if TYPE_CHECKING:
     from netherbrain.agent_runtime.models.session import SessionState
     from netherbrain.agent_runtime.registry import SessionRegistry
     from netherbrain.agent_runtime.settings import NetherSettings
+    from netherbrain.agent_runtime.transport.redis_batcher import RedisStreamBatcher
 
 
 # ---------------------------------------------------------------------------
@@ -165,12 +167,14 @@ class ExecutionManager:
         settings: NetherSettings,
         session_factory: async_sessionmaker,
         redis: aioredis.Redis | None,
+        stream_batcher: RedisStreamBatcher | None = None,
     ) -> None:
         self._session_manager = session_manager
         self._registry = registry
         self._settings = settings
         self._session_factory = session_factory
         self._redis = redis
+        self._stream_batcher = stream_batcher
 
     # -- Conversation operations -----------------------------------------------
 
@@ -236,6 +240,7 @@ class ExecutionManager:
             registry=self._registry,
             settings=self._settings,
             redis=self._redis,
+            stream_batcher=self._stream_batcher,
             config=config,
             input_parts=input_parts or [],
             transport=transport,
@@ -303,12 +308,13 @@ class ExecutionManager:
             registry=self._registry,
             settings=self._settings,
             redis=self._redis,
+            stream_batcher=self._stream_batcher,
             config=config,
             input_parts=input_parts or [],
             transport=transport,
             parent_session_id=parent_row.session_id,
             parent_state=parent_state,
-            conversation_id=uuid.uuid4().hex,
+            conversation_id=secrets.token_hex(16),
             user_id=user_id,
             external_tools=external_tools,
             execution_manager=self,
@@ -348,7 +354,7 @@ class ExecutionManager:
 
         parent_row, parent_state = await self._resolve_fork_point(db, conversation_id, from_session_id)
 
-        new_conversation_id = uuid.uuid4().hex
+        new_conversation_id = secrets.token_hex(16)
 
         # Create a new session in the new conversation, linked to the parent.
         session_row = await self._session_manager.create_session(
@@ -478,7 +484,7 @@ class ExecutionManager:
 
         # Drain mailbox (atomic claim with temporary marker).
         # We use a temporary ID; will update to real session ID after launch.
-        temp_claim = uuid.uuid4().hex
+        temp_claim = secrets.token_hex(16)
         drained = await drain_undelivered(db, conversation_id=conversation_id, delivered_to=temp_claim)
 
         if not drained:
@@ -493,7 +499,7 @@ class ExecutionManager:
                     message_id=msg.message_id,
                     source_session_id=msg.source_session_id,
                     source_type=MailboxSourceType(msg.source_type),
-                    subagent_name=msg.subagent_name,
+                    subagent_name=sys.intern(msg.subagent_name),
                     final_message=source_row.final_message if source_row else None,
                 )
             )
@@ -521,6 +527,7 @@ class ExecutionManager:
                 registry=self._registry,
                 settings=self._settings,
                 redis=self._redis,
+                stream_batcher=self._stream_batcher,
                 config=config,
                 input_parts=continuation_input,
                 transport=transport,
@@ -633,7 +640,7 @@ class ExecutionManager:
 
         conversation_id: str | None = None
         if parent_session_id and fork:
-            conversation_id = uuid.uuid4().hex
+            conversation_id = secrets.token_hex(16)
 
         return await launch_session(
             db=db,
@@ -642,6 +649,7 @@ class ExecutionManager:
             registry=self._registry,
             settings=self._settings,
             redis=self._redis,
+            stream_batcher=self._stream_batcher,
             config=config,
             input_parts=input_parts or [],
             transport=transport,
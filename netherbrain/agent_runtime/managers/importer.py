@@ -17,7 +17,7 @@ from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from netherbrain.agent_runtime.db.tables import Preset, Workspace
-from netherbrain.agent_runtime.managers.presets import _to_row_kwargs, _unset_all_defaults
+from netherbrain.agent_runtime.managers.presets import _to_row_kwargs, _unset_all_defaults, invalidate_preset_cache
 from netherbrain.agent_runtime.models.api import PresetCreate, WorkspaceCreate
 
 logger = logging.getLogger(__name__)
@@ -80,6 +80,8 @@ async def apply_import(db: AsyncSession, data: dict) -> ImportResult:
     # -- Single commit for all changes -----------------------------------------
     if result.total > 0:
         await db.commit()
+        if result.presets_created or result.presets_updated:
+            invalidate_preset_cache()
 
     return result
 
@@ -98,7 +100,7 @@ async def _upsert_preset(db: AsyncSession, raw: dict, result: ImportResult) -> N
     if body.is_default:
         await _unset_all_defaults(db)
 
-    row_data = _to_row_kwargs(body.model_dump(exclude={"preset_id"}))
+    row_data = _to_row_kwargs(body, exclude={"preset_id"})
 
     if existing is None:
         # Create.
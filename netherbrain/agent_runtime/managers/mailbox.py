@@ -9,7 +9,7 @@ to continuation sessions via ``drain_undelivered``.
 
 from __future__ import annotations
 
-import uuid
+import secrets
 
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,7 +32,7 @@ async def post_message(
     a terminal state (committed or failed).
     """
     row = MailboxMessage(
-        message_id=uuid.uuid4().hex,
+        message_id=secrets.token_hex(16),
         conversation_id=conversation_id,
         source_session_id=source_session_id,
         source_type=source_type,
@@ -1,20 +1,67 @@
 """Preset CRUD operations.
 
 Encapsulates all preset data access: create, list, get, update, delete,
-and the ``is_default`` mutual exclusion rule.
+the ``is_default`` mutual exclusion rule, and the read cache the config
+resolver loads presets through.
 """
 
 from __future__ import annotations
 
+import time
 import uuid
+from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, inspect, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from netherbrain.agent_runtime.db.tables import Preset
 from netherbrain.agent_runtime.models.api import PresetCreate, PresetUpdate
 
+# -- Preset cache --------------------------------------------------------------
+#
+# Presets are read-mostly and loaded on every run.  Resolved rows are kept for
+# a short TTL keyed by preset_id (``None`` = the default preset).  Writes
+# through this module invalidate the cache of the current process only; other
+# workers may serve a stale preset for up to ``PRESET_CACHE_TTL_SECONDS``
+# (see docs/presets.md).
+
+PRESET_CACHE_TTL_SECONDS = 30.0
+_PRESET_CACHE_SIZE = 256
+_PRESET_COLUMNS = tuple(attr.key for attr in inspect(Preset).column_attrs)
+
+_preset_cache: dict[str | None, tuple[float, Preset]] = {}
+
+
+def invalidate_preset_cache() -> None:
+    """Drop all cached presets (call after any preset write)."""
+    _preset_cache.clear()
+
+
+def get_cached_preset(key: str | None) -> Preset | None:
+    """Return the cached preset for *key* if it is still fresh."""
+    cached = _preset_cache.get(key)
+    if cached is None:
+        return None
+    expires_at, row = cached
+    if time.monotonic() < expires_at:
+        return row
+    del _preset_cache[key]
+    return None
+
+
+def cache_preset(key: str | None, row: Preset) -> Preset:
+    """Store a detached copy of *row* under *key* and return the copy.
+
+    The copy is transient, so a rollback or close of the loading session
+    cannot expire it under later readers.
+    """
+    snapshot = Preset(**{col: getattr(row, col) for col in _PRESET_COLUMNS})
+    if len(_preset_cache) >= _PRESET_CACHE_SIZE:
+        _preset_cache.pop(next(iter(_preset_cache)))
+    _preset_cache[key] = (time.monotonic() + PRESET_CACHE_TTL_SECONDS, snapshot)
+    return snapshot
+
 
 class DuplicatePresetError(ValueError):
     """Raised when a preset with the given ID already exists."""
@@ -31,20 +78,26 @@ class DefaultPresetConflictError(ValueError):
         super().__init__("Another preset was concurrently set as default; please retry")
 
 
-def _to_row_kwargs(data: dict) -> dict:
-    """Convert Pydantic-dumped dict to ORM column values.
+# JSONB columns whose server_default ('[]' / '{}') reads back identically to
+# the Pydantic default.  When the caller omits them, the INSERT leaves them
+# out and Postgres fills the default -- no client-side JSON encode.
+# ``environment`` is deliberately absent: the resolver treats keys present in
+# the raw dict as "explicitly set" (see ``_resolve_env_field``).
+_SERVER_DEFAULTED_FIELDS = frozenset({"toolsets", "tool_config", "subagents", "mcp_servers"})
+
+# Parameterless statements, built once rather than per call.
+_LIST_PRESETS_STMT = select(Preset).order_by(Preset.created_at.desc())
+_UNSET_DEFAULTS_STMT = update(Preset).where(Preset.is_default.is_(True)).values(is_default=False)
 
-    Nested Pydantic models (model, toolsets, environment, subagents) are stored
-    as plain dicts/lists in JSONB columns.
+
+def _to_row_kwargs(body: PresetCreate | PresetUpdate, **dump_kwargs: Any) -> dict:
+    """Dump a preset body to ORM column values.
+
+    ``model_dump`` serializes the nested models (model, toolsets, environment,
+    subagents, ...) to plain dicts/lists for the JSONB columns in the same
+    pass, so there is nothing left to convert afterwards.
     """
-    for key in ("model", "environment", "subagents"):
-        if key in data and hasattr(data[key], "model_dump"):
-            data[key] = data[key].model_dump()
-    if "toolsets" in data and isinstance(data["toolsets"], list):
-        data["toolsets"] = [t.model_dump() if hasattr(t, "model_dump") else t for t in data["toolsets"]]
-    if "mcp_servers" in data and isinstance(data["mcp_servers"], list):
-        data["mcp_servers"] = [s.model_dump() if hasattr(s, "model_dump") else s for s in data["mcp_servers"]]
-    return data
+    return body.model_dump(**dump_kwargs)
 
 
 async def create_preset(db: AsyncSession, body: PresetCreate) -> Preset:
@@ -57,7 +110,8 @@ async def create_preset(db: AsyncSession, body: PresetCreate) -> Preset:
     if body.is_default:
         await _unset_all_defaults(db)
 
-    row_data = _to_row_kwargs(body.model_dump(exclude={"preset_id"}))
+    omitted = _SERVER_DEFAULTED_FIELDS - body.model_fields_set
+    row_data = _to_row_kwargs(body, exclude={"preset_id", *omitted})
     preset = Preset(preset_id=preset_id, **row_data)
     db.add(preset)
     try:
@@ -67,13 +121,14 @@ async def create_preset(db: AsyncSession, body: PresetCreate) -> Preset:
         if "ix_presets_is_default" in str(exc):
             raise DefaultPresetConflictError from None
         raise DuplicatePresetError(preset_id) from None
+    invalidate_preset_cache()
     await db.refresh(preset)
     return preset
 
 
 async def list_presets(db: AsyncSession) -> list[Preset]:
     """List all presets, ordered by creation time (newest first)."""
-    result = await db.execute(select(Preset).order_by(Preset.created_at.desc()))
+    result = await db.execute(_LIST_PRESETS_STMT)
     return list(result.scalars().all())
 
 
@@ -86,41 +141,42 @@ async def get_preset(db: AsyncSession, preset_id: str) -> Preset:
 
 
 async def update_preset(db: AsyncSession, preset_id: str, body: PresetUpdate) -> Preset:
-    """Partially update a preset.  Raises ``PresetNotFoundError`` if missing."""
-    preset = await db.get(Preset, preset_id)
-    if preset is None:
-        raise PresetNotFoundError(preset_id)
+    """Partially update a preset.  Raises ``PresetNotFoundError`` if missing.
 
-    changes = _to_row_kwargs(body.model_dump(exclude_unset=True))
+    Changes are written with a single ``UPDATE ... RETURNING``, which also
+    tells us whether the preset exists.
+    """
+    changes = _to_row_kwargs(body, exclude_unset=True)
     if not changes:
-        return preset
-
-    if changes.get("is_default"):
-        await _unset_all_defaults(db)
-
-    for key, value in changes.items():
-        setattr(preset, key, value)
+        return await get_preset(db, preset_id)
 
     try:
+        if changes.get("is_default"):
+            await _unset_all_defaults(db)
+        stmt = update(Preset).where(Preset.preset_id == preset_id).values(**changes).returning(Preset)
+        preset = (await db.execute(stmt)).scalar_one_or_none()
+        if preset is None:
+            await db.rollback()  # Undo the defaults reset above, if any.
+            raise PresetNotFoundError(preset_id)
         await db.commit()
     except IntegrityError as exc:
         await db.rollback()
         if "ix_presets_is_default" in str(exc):
             raise DefaultPresetConflictError from None
         raise  # Re-raise unexpected integrity errors.
-    await db.refresh(preset)
+    invalidate_preset_cache()
     return preset
 
 
 async def delete_preset(db: AsyncSession, preset_id: str) -> None:
     """Delete a preset.  Raises ``PresetNotFoundError`` if missing."""
-    preset = await db.get(Preset, preset_id)
-    if preset is None:
+    stmt = delete(Preset).where(Preset.preset_id == preset_id).returning(Preset.preset_id)
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
         raise PresetNotFoundError(preset_id)
-    await db.delete(preset)
     await db.commit()
+    invalidate_preset_cache()
 
 
 async def _unset_all_defaults(db: AsyncSession) -> None:
     """Set ``is_default=False`` on all presets."""
-    await db.execute(update(Preset).where(Preset.is_default.is_(True)).values(is_default=False))
+    await db.execute(_UNSET_DEFAULTS_STMT)
@@ -13,13 +13,15 @@ access follows FastAPI's per-request dependency injection pattern.
 
 from __future__ import annotations
 
-import uuid
+import asyncio
+import secrets
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from sqlalchemy import select, update
+from sqlalchemy import literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from netherbrain.agent_runtime.db.tables import Conversation as ConversationRow
 from netherbrain.agent_runtime.db.tables import Session as SessionRow
@@ -29,18 +31,18 @@ from netherbrain.agent_runtime.models.enums import (
     SessionType,
     Transport,
 )
-from netherbrain.agent_runtime.models.session import RunSummary, SessionState, UsageSummary
+from netherbrain.agent_runtime.models.session import ModelUsageSummary, RunSummary, SessionState, UsageSummary
 from netherbrain.agent_runtime.store.base import DisplayMessages
 
 if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from netherbrain.agent_runtime.db.tables import Session as SessionRow
     from netherbrain.agent_runtime.registry import SessionRegistry
     from netherbrain.agent_runtime.store.base import StateStore
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     """Hydrated session data returned by ``SessionManager.get_session``.
 
@@ -57,7 +59,7 @@ class SessionData:
     """Full SDK state (only loaded when ``include_state=True``)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnData:
     """A single turn (session) in a conversation's turn history."""
 
@@ -68,7 +70,7 @@ class TurnData:
     display_messages: DisplayMessages | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnsPage:
     """Paginated turn history for a conversation."""
 
@@ -78,6 +80,9 @@ class TurnsPage:
 
 _TITLE_MAX_LEN = 50
 
+# Statuses of sessions whose state has been written (turn history, lineage).
+_COMMITTED_STATUSES = (SessionStatus.COMMITTED, SessionStatus.AWAITING_TOOL_RESULTS)
+
 
 def _extract_title(input_parts: list[dict[str, Any]] | None) -> str | None:
     """Extract a short title from the first text input part.
@@ -102,12 +107,21 @@ class SessionManager:
     """Manages the full session lifecycle (create -> commit/fail).
 
     Instantiated once during app lifespan.  Stateless beyond its references
-    to the state store and session registry.
+    to the state store and session registry, plus a startup-recovery flag.
     """
 
     def __init__(self, store: StateStore, registry: SessionRegistry) -> None:
         self._store = store
         self._registry = registry
+        # Cleared while startup recovery runs; ``create_session`` waits on it
+        # so a new row can never be swept up by the orphan UPDATE.
+        self._recovered = asyncio.Event()
+        self._recovered.set()
+
+    @property
+    def recovered(self) -> bool:
+        """Whether startup recovery has finished (always true if never started)."""
+        return self._recovered.is_set()
 
     # -- Create ----------------------------------------------------------------
 
@@ -133,23 +147,49 @@ class SessionManager:
         - Fork: caller provides a new ``conversation_id`` (or one is generated)
         - Async subagent: ``conversation_id = spawner.conversation_id``
         """
-        session_id = uuid.uuid4().hex
-
-        # Resolve conversation_id based on lineage rules.
-        if parent_session_id is not None and conversation_id is None:
+        await self._recovered.wait()
+        session_id = secrets.token_hex(16)
+
+        # Resolve conversation_id based on lineage rules.  Only a
+        # caller-supplied conversation may or may not exist yet: a root
+        # session always starts a new one, and a continuation's parent row
+        # references an existing one (FK).
+        if conversation_id is not None:
+            # Fork / async subagent: the target conversation may not exist yet.
+            # With an owner at hand, insert-if-absent in one statement;
+            # Postgres resolves the existence check (and any race) itself.
+            if user_id is not None:
+                await db.execute(
+                    pg_insert(ConversationRow)
+                    .values(
+                        conversation_id=conversation_id,
+                        user_id=user_id,
+                        status=ConversationStatus.ACTIVE,
+                        title=_extract_title(input_parts),
+                        default_preset_id=preset_id,
+                    )
+                    .on_conflict_do_nothing(index_elements=[ConversationRow.conversation_id])
+                )
+                new_conversation = False
+            else:
+                new_conversation = await db.get(ConversationRow, conversation_id) is None
+        elif parent_session_id is not None:
             # Continuation: inherit from parent.
-            parent = await db.get(SessionRow, parent_session_id)
-            if parent is None:
+            parent_conversation_id = await db.scalar(
+                select(SessionRow.conversation_id).where(SessionRow.session_id == parent_session_id)
+            )
+            if parent_conversation_id is None:
                 msg = f"Parent session '{parent_session_id}' not found"
                 raise ValueError(msg)
-            conversation_id = parent.conversation_id
-        elif conversation_id is None:
+            conversation_id = parent_conversation_id
+            new_conversation = False
+        else:
             # Root session: conversation_id = session_id.
             conversation_id = session_id
+            new_conversation = True
 
-        # Ensure conversation index row exists.
-        existing_conv = await db.get(ConversationRow, conversation_id)
-        if existing_conv is None:
+        # Add a new conversation index row (root session).
+        if new_conversation:
             if user_id is None:
                 msg = "user_id is required when creating a new conversation"
                 raise ValueError(msg)
@@ -176,8 +216,9 @@ class SessionManager:
             input=input_parts,
         )
         db.add(session_row)
+        # Server defaults (created_at, ...) come back via INSERT ... RETURNING
+        # on flush, so no refresh round-trip is needed.
         await db.commit()
-        await db.refresh(session_row)
 
         logger.info(
             "Session created: {} (conversation={}, parent={})",
@@ -206,17 +247,10 @@ class SessionManager:
         This is called after successful execution.  The session is immutable
         after commit -- no further writes to its state.
         """
-        if status not in (SessionStatus.COMMITTED, SessionStatus.AWAITING_TOOL_RESULTS):
+        if status not in _COMMITTED_STATUSES:
             msg = f"Cannot commit with status '{status}'; use fail_session for failures"
             raise ValueError(msg)
 
-        # Write SDK state blob to state store.
-        await self._store.write_state(session_id, state)
-
-        # Write display messages (optional, separate file).
-        if display_messages is not None:
-            await self._store.write_display_messages(session_id, display_messages)
-
         # Update PG index (status, final_message, deferred_tools, run_summary).
         values: dict[str, Any] = {"status": status}
         if final_message is not None:
@@ -226,14 +260,29 @@ class SessionManager:
         if run_summary is not None:
             values["run_summary"] = run_summary.model_dump()
 
-        stmt = update(SessionRow).where(SessionRow.session_id == session_id).values(**values)
-        await db.execute(stmt)
+        stmt = update(SessionRow).where(SessionRow.session_id == session_id).values(**values).returning(SessionRow)
+
+        # The state blob, the display messages (optional, separate file) and
+        # the PG update are independent, so they run concurrently.  The
+        # transaction is only committed once the store writes have landed:
+        # a committed status must never point at state that is not there yet.
+        writes = [self._store.write_state(session_id, state), db.execute(stmt)]
+        if display_messages is not None:
+            writes.append(self._store.write_display_messages(session_id, display_messages))
+        # ``return_exceptions`` lets every write settle before we react: the
+        # UPDATE must not still be running on ``db`` when it is rolled back.
+        state_result, result, *display_result = await asyncio.gather(*writes, return_exceptions=True)
+        errors = [r for r in (state_result, *display_result, result) if isinstance(r, BaseException)]
+        if errors:
+            # Leave nothing pending for the caller's fail_session on this db.
+            await db.rollback()
+            raise errors[0]
+        row = result.scalar_one_or_none()  # type: ignore[union-attr]
         await db.commit()
 
         # Unregister from in-memory registry.
         self._registry.unregister(session_id)
 
-        row = await db.get(SessionRow, session_id)
         logger.info("Session committed: {} (status={})", session_id, status)
         return row  # type: ignore[return-value]
 
@@ -289,15 +338,34 @@ class SessionManager:
         *,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
     ) -> list[SessionRow]:
-        """List sessions for a conversation, ordered by creation time."""
+        """List sessions for a conversation, ordered by creation time.
+
+        ``after`` is a session_id cursor: only sessions created after it
+        are returned (keyset pagination, constant cost at any depth).
+        Raises ``LookupError`` if the ``after`` session is not in this
+        conversation.
+        """
         stmt = (
             select(SessionRow)
             .where(SessionRow.conversation_id == conversation_id)
-            .order_by(SessionRow.created_at.asc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(SessionRow.created_at.asc(), SessionRow.session_id.asc())
         )
+        if after is not None:
+            after_at = await db.scalar(
+                select(SessionRow.created_at).where(
+                    SessionRow.session_id == after,
+                    SessionRow.conversation_id == conversation_id,
+                )
+            )
+            if after_at is None:
+                msg = f"Session '{after}' not found in conversation '{conversation_id}'"
+                raise LookupError(msg)
+            stmt = stmt.where(
+                tuple_(SessionRow.created_at, SessionRow.session_id) > tuple_(literal(after_at), literal(after))
+            )
+        stmt = stmt.limit(limit).offset(offset)
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
@@ -317,10 +385,7 @@ class SessionManager:
             select(SessionRow)
             .where(
                 SessionRow.conversation_id == conversation_id,
-                SessionRow.status.in_([
-                    SessionStatus.COMMITTED,
-                    SessionStatus.AWAITING_TOOL_RESULTS,
-                ]),
+                SessionRow.status.in_(_COMMITTED_STATUSES),
             )
             .order_by(SessionRow.created_at.desc())
             .limit(1)
@@ -358,10 +423,7 @@ class SessionManager:
         """
         base_filter = [
             SessionRow.conversation_id == conversation_id,
-            SessionRow.status.in_([
-                SessionStatus.COMMITTED,
-                SessionStatus.AWAITING_TOOL_RESULTS,
-            ]),
+            SessionRow.status.in_(_COMMITTED_STATUSES),
         ]
 
         # Cursor filter: turns older than the given session_id.
@@ -400,18 +462,23 @@ class SessionManager:
         if fetch_count is not None:
             rows = list(reversed(rows))
 
-        turns: list[TurnData] = []
-        for row in rows:
-            display = await self._store.read_display_messages(row.session_id) if include_display else None
-            turns.append(
-                TurnData(
-                    session_id=row.session_id,
-                    input=row.input,
-                    final_message=row.final_message,
-                    created_at=row.created_at,
-                    display_messages=display,
-                )
+        # Display messages live in the state store, one object per session;
+        # fetch them concurrently rather than one round-trip at a time.
+        if include_display:
+            displays = await asyncio.gather(*(self._store.read_display_messages(row.session_id) for row in rows))
+        else:
+            displays = [None] * len(rows)
+
+        turns = [
+            TurnData(
+                session_id=row.session_id,
+                input=row.input,
+                final_message=row.final_message,
+                created_at=row.created_at,
+                display_messages=display,
             )
+            for row, display in zip(rows, displays, strict=True)
+        ]
         return TurnsPage(turns=turns, has_more=has_more)
 
     # -- Usage aggregation -----------------------------------------------------
@@ -429,10 +496,7 @@ class SessionManager:
         """
         stmt = select(SessionRow.run_summary).where(
             SessionRow.conversation_id == conversation_id,
-            SessionRow.status.in_([
-                SessionStatus.COMMITTED,
-                SessionStatus.AWAITING_TOOL_RESULTS,
-            ]),
+            SessionRow.status.in_(_COMMITTED_STATUSES),
             SessionRow.run_summary.isnot(None),
         )
         result = await db.execute(stmt)
@@ -472,22 +536,50 @@ class SessionManager:
         if not aggregated:
             return None
 
-        from netherbrain.agent_runtime.models.session import ModelUsageSummary
-
         return UsageSummary(
             model_usages={model_id: ModelUsageSummary(**counts) for model_id, counts in aggregated.items()}
         )
 
     # -- Startup recovery ------------------------------------------------------
 
+    def start_recovery(self, session_factory: async_sessionmaker[AsyncSession]) -> asyncio.Task[int]:
+        """Run :meth:`recover_orphaned_sessions` in the background.
+
+        Lets the lifespan yield (and the port start accepting) without waiting
+        on the UPDATE.  Until it finishes, :attr:`recovered` is false and
+        ``create_session`` blocks.  Failures are logged, never raised.
+        """
+        self._recovered.clear()
+        return asyncio.create_task(self._run_recovery(session_factory), name="session-recovery")
+
+    async def _run_recovery(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        try:
+            async with session_factory() as db:
+                return await self.recover_orphaned_sessions(db)
+        except Exception:
+            logger.exception("Startup recovery failed")
+            return 0
+        finally:
+            self._recovered.set()
+
     @staticmethod
     async def recover_orphaned_sessions(db: AsyncSession) -> int:
         """Mark orphaned sessions (status=created) as failed.
 
         Called once at startup to reconcile PG with the empty registry after
         a crash or restart.  Returns the number of sessions recovered.
+
+        Issued as one set-based UPDATE (served by ``ix_sessions_status``) so
+        startup cost stays a single round-trip however many rows are orphaned.
+        The session is fresh at startup, so ORM identity-map synchronisation
+        is skipped.
         """
-        stmt = update(SessionRow).where(SessionRow.status == SessionStatus.CREATED).values(status=SessionStatus.FAILED)
+        stmt = (
+            update(SessionRow)
+            .where(SessionRow.status == SessionStatus.CREATED)
+            .values(status=SessionStatus.FAILED)
+            .execution_options(synchronize_session=False)
+        )
         result = await db.execute(stmt)
         await db.commit()
         count = result.rowcount  # type: ignore[assignment]
@@ -44,7 +44,7 @@ class EmptyConversationError(ValueError):
         super().__init__("Conversation has no committed sessions to summarize.")
 
 
-@dataclass
+@dataclass(slots=True)
 class _SessionContent:
     """Extracted text from a single session."""
 
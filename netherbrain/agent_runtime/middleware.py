@@ -25,6 +25,7 @@ BOOTSTRAP_ADMIN_ID = "admin"
 # Paths that bypass authentication.
 _AUTH_EXEMPT_PATHS = {
     ("GET", "/api/health"),
+    ("GET", "/api/ready"),
     ("POST", "/api/auth/login"),
 }
 
@@ -82,9 +83,9 @@ async def _authenticate(scope: Scope) -> AuthContext | JSONResponse:
 
     Returns ``AuthContext`` on success, or a ``JSONResponse`` error.
     """
-    # Read expected root token from app state.
+    # Read expected root token from app state (pre-encoded once in lifespan).
     try:
-        root_token: str | None = scope["app"].state.auth_token
+        root_token: bytes | None = scope["app"].state.auth_token_bytes
     except (KeyError, AttributeError):
         return JSONResponse(status_code=503, content={"detail": "Auth not initialized."})
 
@@ -107,7 +108,7 @@ async def _authenticate(scope: Scope) -> AuthContext | JSONResponse:
         )
 
     # 1. Root token (constant-time, no DB).
-    if root_token is not None and hmac.compare_digest(token, root_token):
+    if root_token is not None and hmac.compare_digest(token.encode(), root_token):
         auth = AuthContext(user_id=BOOTSTRAP_ADMIN_ID, role=UserRole.ADMIN, key_id=ROOT_KEY_ID)
         return _apply_delegation(auth, headers)
 
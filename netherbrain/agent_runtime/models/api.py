@@ -613,3 +613,8 @@ class ResetPasswordResponse(BaseModel):
     """Response for admin-initiated password reset."""
 
     password: str
+
+
+# ConversationDetailResponse refers to ActiveSessionInfo, defined further
+# down; resolve it now so the schema is not built on the first request.
+ConversationDetailResponse.model_rebuild()
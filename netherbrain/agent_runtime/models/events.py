@@ -12,12 +12,12 @@ Runtime extensions:
     ``ag_ui.core.CustomEvent`` with a descriptive ``name`` field.
 
 Transport helpers:
-    ``is_terminal()``, ``encode_sse()``, ``TERMINAL_TYPES``.
+    ``is_terminal()``, ``encode_sse()``, ``event_json()``, ``TERMINAL_TYPES``.
 """
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from enum import StrEnum
 
 from ag_ui.core import (
@@ -70,6 +70,7 @@ __all__ = [
     "ToolCallStartEvent",
     "encode_sse",
     "event_id",
+    "event_json",
     "is_terminal",
 ]
 
@@ -112,7 +113,7 @@ def is_terminal(event: BaseEvent) -> bool:
 
 def event_id() -> str:
     """Generate a short unique event ID for SSE ``id:`` field."""
-    return uuid.uuid4().hex[:12]
+    return secrets.token_hex(6)
 
 
 # ---------------------------------------------------------------------------
@@ -120,6 +121,16 @@ def event_id() -> str:
 # ---------------------------------------------------------------------------
 
 
+def event_json(evt: BaseEvent) -> bytes:
+    """Serialize an AG-UI event to JSON bytes (camelCase, no nulls).
+
+    Calls the model's pydantic-core serializer directly, skipping the
+    Python-side argument handling of ``model_dump_json`` and its bytes ->
+    str conversion.
+    """
+    return evt.__pydantic_serializer__.to_json(evt, by_alias=True, exclude_none=True)
+
+
 def encode_sse(evt: BaseEvent, *, sse_id: str | None = None) -> dict[str, str]:
     """Format an AG-UI event for sse-starlette.
 
@@ -130,5 +141,5 @@ def encode_sse(evt: BaseEvent, *, sse_id: str | None = None) -> dict[str, str]:
     """
     return {
         "id": sse_id or event_id(),
-        "data": evt.model_dump_json(by_alias=True, exclude_none=True),
+        "data": event_json(evt).decode(),
     }
@@ -15,6 +15,14 @@ from pydantic import BaseModel, Field, model_validator
 
 from netherbrain.agent_runtime.models.enums import InputPartType, StorageMode
 
+# Payload field that must be set for each part type.
+_PAYLOAD_FIELDS: dict[InputPartType, str] = {
+    InputPartType.TEXT: "text",
+    InputPartType.URL: "url",
+    InputPartType.FILE: "path",
+    InputPartType.BINARY: "data",
+}
+
 
 class InputPart(BaseModel):
     """A single content part in user input.
@@ -53,23 +61,10 @@ class InputPart(BaseModel):
     @model_validator(mode="after")
     def _validate_payload(self) -> InputPart:
         """Ensure the correct payload field is set for the part type."""
-        match self.type:
-            case InputPartType.TEXT:
-                if not self.text:
-                    msg = "text field is required when type='text'"
-                    raise ValueError(msg)
-            case InputPartType.URL:
-                if not self.url:
-                    msg = "url field is required when type='url'"
-                    raise ValueError(msg)
-            case InputPartType.FILE:
-                if not self.path:
-                    msg = "path field is required when type='file'"
-                    raise ValueError(msg)
-            case InputPartType.BINARY:
-                if not self.data:
-                    msg = "data field is required when type='binary'"
-                    raise ValueError(msg)
+        field = _PAYLOAD_FIELDS[self.type]
+        if not getattr(self, field):
+            msg = f"{field} field is required when type='{self.type.value}'"
+            raise ValueError(msg)
         return self
 
 
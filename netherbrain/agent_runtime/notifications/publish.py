@@ -6,11 +6,11 @@ disrupting the main execution path.
 
 from __future__ import annotations
 
-import json
 from dataclasses import asdict
 from typing import TYPE_CHECKING
 
 from loguru import logger
+from pydantic_core import to_json
 
 if TYPE_CHECKING:
     import redis.asyncio as aioredis
@@ -32,7 +32,7 @@ async def publish_notification(
     if redis is None:
         return
     try:
-        payload = json.dumps(asdict(event), ensure_ascii=False)
+        payload = to_json(asdict(event))  # UTF-8 bytes, no ASCII escaping
         await redis.publish(CHANNEL, payload)
     except Exception:
         logger.warning("Failed to publish notification: {}", event.type, exc_info=True)
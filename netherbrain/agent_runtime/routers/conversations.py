@@ -306,7 +306,12 @@ async def handle_events(
         raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, detail="Redis not configured.")
 
     try:
-        generator = bridge_stream_to_sse(redis, active.session_id, last_event_id=last_event_id)
+        generator = bridge_stream_to_sse(
+            redis,
+            active.session_id,
+            last_event_id=last_event_id,
+            shutdown=getattr(request.app.state, "sse_shutdown", None),
+        )
         return EventSourceResponse(generator)
     except StreamGoneError:
         raise HTTPException(status.HTTP_410_GONE, detail=f"Stream for session '{active.session_id}' expired.") from None
@@ -325,7 +330,10 @@ async def handle_list_conversations(
     metadata_contains: str | None = Query(None),
     limit: int = Query(20, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    before: str | None = Query(None, description="Return conversations older than this conversation_id."),
 ) -> list:
+    if before is not None and offset:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Use either 'offset' or 'before', not both.")
     try:
         return await list_conversations(
             db,
@@ -334,7 +342,10 @@ async def handle_list_conversations(
             metadata_contains=metadata_contains,
             limit=limit,
             offset=offset,
+            before=before,
         )
+    except ConversationNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Cursor conversation '{before}' not found.") from None
     except ValueError as exc:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from None
 
@@ -547,13 +558,19 @@ async def handle_list_conversation_sessions(
     auth: CurrentUser,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Return sessions created after this session_id."),
 ) -> list:
+    if after is not None and offset:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Use either 'offset' or 'after', not both.")
     try:
         await get_conversation(db, conversation_id, user_id=auth.user_id, is_admin=auth.is_admin)
     except ConversationNotFoundError:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Conversation '{conversation_id}' not found.") from None
 
-    return await manager.list_sessions(db, conversation_id, limit=limit, offset=offset)
+    try:
+        return await manager.list_sessions(db, conversation_id, limit=limit, offset=offset, after=after)
+    except LookupError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Cursor session '{after}' not found.") from None
 
 
 # ---------------------------------------------------------------------------
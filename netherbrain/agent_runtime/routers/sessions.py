@@ -139,7 +139,12 @@ async def handle_session_events(
         raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, detail="Redis not configured.")
 
     try:
-        generator = bridge_stream_to_sse(redis, session_id, last_event_id=last_event_id)
+        generator = bridge_stream_to_sse(
+            redis,
+            session_id,
+            last_event_id=last_event_id,
+            shutdown=getattr(request.app.state, "sse_shutdown", None),
+        )
         return EventSourceResponse(generator)
     except StreamGoneError:
         raise HTTPException(status.HTTP_410_GONE, detail=f"Stream for session '{session_id}' expired.") from None
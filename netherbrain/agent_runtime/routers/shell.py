@@ -14,7 +14,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
-import uuid
+import secrets
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 from loguru import logger
@@ -83,7 +83,7 @@ async def shell_connect(websocket: WebSocket, project_id: str) -> None:
     await websocket.accept()
 
     # -- Spawn PTY and register ------------------------------------------------
-    shell_id = f"shell-{uuid.uuid4().hex[:12]}"
+    shell_id = f"shell-{secrets.token_hex(6)}"
     registry = _get_shell_registry(websocket)
 
     try:
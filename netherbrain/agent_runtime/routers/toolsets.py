@@ -7,6 +7,8 @@ toolset registry; no database access is required.
 
 from __future__ import annotations
 
+from functools import cache
+
 from fastapi import APIRouter
 
 from netherbrain.agent_runtime.execution.runtime import (
@@ -33,6 +35,9 @@ _DESCRIPTIONS: dict[str, str] = {
 }
 
 
+# Built on the first request (the registry is static after startup).  Listing
+# imports every toolset module, which would otherwise slow app startup.
+@cache
 def _build_toolset_list() -> list[ToolsetInfo]:
     result: list[ToolsetInfo] = []
 
@@ -65,11 +70,7 @@ def _build_toolset_list() -> list[ToolsetInfo]:
     return result
 
 
-# Pre-build at import time (registry is static after startup).
-_TOOLSET_LIST: list[ToolsetInfo] = _build_toolset_list()
-
-
 @router.get("", response_model=list[ToolsetInfo])
 async def handle_list_toolsets() -> list[ToolsetInfo]:
     """Return all available toolsets and their tools."""
-    return _TOOLSET_LIST
+    return _build_toolset_list()
@@ -39,9 +39,14 @@ async def handle_list_workspaces(
     ),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    before: str | None = Query(None, description="Return workspaces older than this workspace_id."),
 ) -> list:
+    if before is not None and offset:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Use either 'offset' or 'before', not both.")
     try:
-        return await list_workspaces(db, metadata_contains=metadata_contains, limit=limit, offset=offset)
+        return await list_workspaces(db, metadata_contains=metadata_contains, limit=limit, offset=offset, before=before)
+    except WorkspaceNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Cursor workspace '{before}' not found.") from None
     except ValueError as exc:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from None
 
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import SecretStr
+from pydantic import SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+PSYCOPG_URL_PREFIX = "postgresql+psycopg://"
+"""SQLAlchemy dialect prefix used for both sync (Alembic) and async engines."""
+
+_DATABASE_URL_ALIASES = ("postgresql+asyncpg://", "postgresql://", "postgres://")
+
 
 class NetherSettings(BaseSettings):
     """Netherbrain Agent Runtime settings.
@@ -32,7 +37,25 @@ class NetherSettings(BaseSettings):
 
     # -- Infrastructure --------------------------------------------------------
     database_url: str | None = None
-    """PostgreSQL connection string (asyncpg).  Required for full operation."""
+    """PostgreSQL connection string.  Required for full operation.
+
+    Normalised to the ``postgresql+psycopg://`` dialect at load time, so
+    ``postgresql://`` and legacy ``postgresql+asyncpg://`` URLs are accepted.
+    """
+
+    db_expected_concurrency: int = 15
+    """Concurrent DB tasks expected per worker; sizes the connection pool.
+
+    ``pool_size + max_overflow`` is set to this value so bursts do not hit
+    ``QueuePool limit ... timed out``.
+    """
+
+    db_use_pgbouncer: bool = False
+    """Tune the connection pool for PgBouncer in transaction pooling mode.
+
+    Disables pre-ping and server-side prepared statements, and recycles
+    connections aggressively.  See ``db.engine.create_engine``.
+    """
 
     redis_url: str | None = None
     """Redis connection string.  Required for stream transport."""
@@ -103,6 +126,19 @@ class NetherSettings(BaseSettings):
     for the wait to be effective.
     """
 
+    # -- Validators ------------------------------------------------------------
+
+    @field_validator("database_url")
+    @classmethod
+    def _normalise_database_url(cls, value: str | None) -> str | None:
+        """Pin the psycopg3 dialect once so every consumer sees the same URL."""
+        if value is None:
+            return None
+        for prefix in _DATABASE_URL_ALIASES:
+            if value.startswith(prefix):
+                return PSYCOPG_URL_PREFIX + value.removeprefix(prefix)
+        return value
+
     # -- Helpers ---------------------------------------------------------------
 
     @property
@@ -126,7 +162,8 @@ def get_settings() -> NetherSettings:
     """Return a cached settings instance.
 
     Reads from environment variables and ``.env`` on first call, then returns
-    the same object.  Call ``get_settings.cache_clear()`` in tests to force a
+    the same object for the lifetime of the process (one ``.env`` parse per
+    worker).  Call ``_get_settings_cached.cache_clear()`` in tests to force a
     re-read after overriding env vars.
     """
     return _get_settings_cached()
@@ -29,6 +29,7 @@ import tempfile
 from functools import partial
 from pathlib import Path
 
+import pydantic_core
 from anyio import to_thread
 
 from netherbrain.agent_runtime.models.session import SessionState
@@ -58,12 +59,12 @@ class LocalStateStore:
 
     async def write_state(self, session_id: str, state: SessionState) -> None:
         session_dir = self._session_dir(session_id)
-        data = state.model_dump_json(indent=2)
+        data = state.__pydantic_serializer__.to_json(state, indent=2)
         await to_thread.run_sync(partial(_atomic_write, session_dir / "state.json", data))
 
     async def write_display_messages(self, session_id: str, messages: DisplayMessages) -> None:
         session_dir = self._session_dir(session_id)
-        data = json.dumps(messages, ensure_ascii=False, indent=2)
+        data = pydantic_core.to_json(messages, indent=2)
         await to_thread.run_sync(partial(_atomic_write, session_dir / "display_messages.json", data))
 
     # -- Read ------------------------------------------------------------------
@@ -95,7 +96,7 @@ class LocalStateStore:
 # -- Sync helpers (run in thread pool) -----------------------------------------
 
 
-def _atomic_write(path: Path, data: str) -> None:
+def _atomic_write(path: Path, data: bytes) -> None:
     """Write data atomically: temp file + rename.
 
     Ensures readers never see a partially-written file.  The temp file is
@@ -104,7 +105,7 @@ def _atomic_write(path: Path, data: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
+        with os.fdopen(fd, "wb") as f:
             f.write(data)
         os.rename(tmp_path, path)
     except BaseException:
@@ -19,6 +19,7 @@ from functools import partial
 from typing import Any
 
 import boto3
+import pydantic_core
 from anyio import to_thread
 from botocore.config import Config
 
@@ -90,26 +91,26 @@ class S3StateStore:
 
     async def write_state(self, session_id: str, state: SessionState) -> None:
         key = self._object_key(session_id, "state.json")
-        data = state.model_dump_json(indent=2)
+        data = state.__pydantic_serializer__.to_json(state, indent=2)
         await to_thread.run_sync(
             partial(
                 self._client.put_object,
                 Bucket=self._bucket,
                 Key=key,
-                Body=data.encode("utf-8"),
+                Body=data,
                 ContentType="application/json",
             )
         )
 
     async def write_display_messages(self, session_id: str, messages: DisplayMessages) -> None:
         key = self._object_key(session_id, "display_messages.json")
-        data = json.dumps(messages, ensure_ascii=False, indent=2)
+        data = pydantic_core.to_json(messages, indent=2)
         await to_thread.run_sync(
             partial(
                 self._client.put_object,
                 Bucket=self._bucket,
                 Key=key,
-                Body=data.encode("utf-8"),
+                Body=data,
                 ContentType="application/json",
             )
         )
@@ -13,7 +13,6 @@ suitable for writing to ``display_messages.json`` in the state store.
 
 from __future__ import annotations
 
-import json
 from typing import Literal
 
 from ag_ui.core import (
@@ -103,7 +102,9 @@ class _Compressor:
         self._flush_unclosed()
         # Append retained snapshots (only the last of each kind).
         self._result.extend(self._snapshots.values())
-        return [json.loads(evt.model_dump_json(by_alias=True, exclude_none=True)) for evt in self._result]
+        # ``mode="json"`` yields the JSON-ready dicts directly, without a
+        # dump-to-string / json.loads round-trip per event.
+        return [evt.model_dump(mode="json", by_alias=True, exclude_none=True) for evt in self._result]
 
     # -- Text handlers ---------------------------------------------------------
 
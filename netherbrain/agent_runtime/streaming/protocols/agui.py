@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import json
 import logging
-import uuid
+import secrets
 from collections.abc import AsyncIterator
 from dataclasses import asdict
 from typing import Any
@@ -82,7 +82,7 @@ TOOL_STATUS_CANCEL = "cancel"
 
 
 def _new_id() -> str:
-    return uuid.uuid4().hex[:12]
+    return secrets.token_hex(6)
 
 
 class AGUIProtocol(ProtocolAdapter):
@@ -11,6 +11,7 @@ AG-UI event sequences.
 
 from netherbrain.agent_runtime.transport.base import EventTransport
 from netherbrain.agent_runtime.transport.bridge import StreamGoneError, bridge_stream_to_sse
+from netherbrain.agent_runtime.transport.redis_batcher import RedisStreamBatcher
 from netherbrain.agent_runtime.transport.redis_stream import (
     DEFAULT_STREAM_TTL_SECONDS,
     RedisStreamTransport,
@@ -21,6 +22,7 @@ from netherbrain.agent_runtime.transport.sse import SSETransport
 __all__ = [
     "DEFAULT_STREAM_TTL_SECONDS",
     "EventTransport",
+    "RedisStreamBatcher",
     "RedisStreamTransport",
     "SSETransport",
     "StreamGoneError",
@@ -29,6 +29,7 @@ Behavior by session state:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from collections.abc import AsyncIterator
@@ -65,6 +66,7 @@ async def bridge_stream_to_sse(
     last_event_id: str | None = None,
     poll_interval_ms: int = _POLL_INTERVAL_MS,
     max_idle_seconds: float = _MAX_IDLE_SECONDS,
+    shutdown: asyncio.Event | None = None,
 ) -> AsyncIterator[dict[str, str]]:
     """Read events from a Redis Stream and yield SSE-formatted dicts.
 
@@ -74,6 +76,7 @@ async def bridge_stream_to_sse(
     2. Tails for new events using XREAD with blocking
     3. Stops after a terminal event (``run_finished`` / ``run_error``)
     4. Stops if idle for too long (producer likely gone)
+    5. Stops as soon as *shutdown* is set (app is draining), even mid-poll
 
     Raises ``StreamGoneError`` if the stream does not exist.
     """
@@ -82,13 +85,11 @@ async def bridge_stream_to_sse(
     idle_elapsed = 0.0
     poll_seconds = poll_interval_ms / 1000.0
 
-    while True:
+    while shutdown is None or not shutdown.is_set():
         # XREAD with block timeout for live tailing.
-        entries = await redis.xread(
-            {key: cursor},
-            count=100,
-            block=poll_interval_ms,
-        )
+        entries = await _xread_unless_shutdown(redis, key, cursor, poll_interval_ms, shutdown)
+        if entries is None:
+            break
 
         if not entries:
             # No new events.  Check idle timeout.
@@ -122,6 +123,28 @@ async def bridge_stream_to_sse(
                     return
 
 
+async def _xread_unless_shutdown(
+    redis: aioredis.Redis,
+    key: str,
+    cursor: str,
+    block_ms: int,
+    shutdown: asyncio.Event | None,
+) -> list | None:
+    """Blocking XREAD raced against *shutdown*; ``None`` if shutdown won."""
+    xread = redis.xread({key: cursor}, count=100, block=block_ms)
+    if shutdown is None:
+        return await xread
+    read_task = asyncio.ensure_future(xread)
+    shutdown_task = asyncio.ensure_future(shutdown.wait())
+    try:
+        done, _ = await asyncio.wait({read_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Cancel the loser (both, if we are being cancelled ourselves).
+        read_task.cancel()
+        shutdown_task.cancel()
+    return read_task.result() if read_task in done else None
+
+
 async def _init_bridge(
     redis: aioredis.Redis,
     session_id: str,
@@ -0,0 +1,163 @@
+"""Redis Stream batcher -- coalesces XADDs into pipelined round-trips.
+
+Token-level streaming produces many small events per second.  Sending each
+one as its own ``XADD`` costs a full network round-trip; the batcher queues
+them and flushes up to ``max_batch`` entries in a single non-transactional
+pipeline.
+
+A single FIFO queue is shared by all streams, so per-stream ordering is
+preserved.  Flushes happen as soon as the queue runs dry or the batch is
+full, after waiting at most ``max_delay`` seconds for more entries.
+
+Each submitted entry gets a future that resolves once its XADD has been
+written (or fails with the write error), so a submitter can wait for --
+and learn about -- its own entries without waiting on other streams.
+Once the batcher is stopping, ``submit`` writes directly instead of
+queueing into a loop that is about to go away.
+
+Usage::
+
+    batcher = RedisStreamBatcher(redis)
+    batcher.start()
+
+    written = await batcher.submit(key, fields, maxlen=10000)
+    await written  # this entry is in the stream (or its error is raised)
+
+    await batcher.stop()  # drains, then stops the background task
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 16
+DEFAULT_MAX_DELAY_SECONDS = 0.001
+
+
+@dataclass(slots=True)
+class _Entry:
+    key: str
+    fields: dict[str, str | bytes]
+    maxlen: int | None
+    written: asyncio.Future[None]
+
+
+class RedisStreamBatcher:
+    """Background XADD pipeliner shared by all Redis stream transports."""
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+    ) -> None:
+        self._redis = redis
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._queue: asyncio.Queue[_Entry] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush task is alive and accepting entries."""
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if not self.running:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="redis-stream-batcher")
+
+    async def stop(self) -> None:
+        """Flush pending entries, then cancel the background task.
+
+        New entries submitted while stopping are written directly.
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        if not self._task.done():
+            await self._queue.join()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        # Nothing may be left behind if the task died: write it directly.
+        leftover: list[_Entry] = []
+        while not self._queue.empty():
+            leftover.append(self._queue.get_nowait())
+        if leftover:
+            await self._write(leftover)
+
+    async def submit(
+        self, key: str, fields: dict[str, str | bytes], *, maxlen: int | None = None
+    ) -> asyncio.Future[None]:
+        """Queue an XADD and return a future that resolves once it is written.
+
+        The future carries the write error if the XADD fails.  When the
+        batcher is not running (never started, or stopping), the XADD is
+        written directly and errors are raised from this call.
+        """
+        written: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if not self.running:
+            await self._redis.xadd(key, fields, maxlen=maxlen)  # type: ignore[arg-type]
+            written.set_result(None)
+            return written
+        self._queue.put_nowait(_Entry(key, fields, maxlen, written))
+        return written
+
+    # -- Internals -------------------------------------------------------------
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            self._drain_into(batch)
+            if len(batch) < self._max_batch and self._max_delay > 0:
+                await asyncio.sleep(self._max_delay)
+                self._drain_into(batch)
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _drain_into(self, batch: list[_Entry]) -> None:
+        while len(batch) < self._max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _write(self, batch: list[_Entry]) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for entry in batch:
+                    pipe.xadd(entry.key, entry.fields, maxlen=entry.maxlen)  # type: ignore[arg-type]
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as exc:
+            logger.exception("Failed to pipeline %d XADD entries", len(batch))
+            for entry in batch:
+                _settle(entry.written, exc)
+            return
+        for entry, result in zip(batch, results, strict=True):
+            _settle(entry.written, result if isinstance(result, Exception) else None)
+
+
+def _settle(written: asyncio.Future[None], error: BaseException | None) -> None:
+    if written.done():
+        return
+    if error is None:
+        written.set_result(None)
+    else:
+        written.set_exception(error)
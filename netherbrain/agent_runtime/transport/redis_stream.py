@@ -22,14 +22,20 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import deque
 from typing import TYPE_CHECKING
 
-from ag_ui.core import BaseEvent
+from ag_ui.core import BaseEvent, EventType
+
+from netherbrain.agent_runtime.models.events import event_json
 
 if TYPE_CHECKING:
     import redis.asyncio as aioredis
 
+    from netherbrain.agent_runtime.transport.redis_batcher import RedisStreamBatcher
+
 logger = logging.getLogger(__name__)
 
 # Default stream TTL: 5 minutes.  Redis Streams are ephemeral buffers
@@ -52,6 +58,12 @@ class RedisStreamTransport:
 
     - ``type``: event type string (for filtering)
     - ``data``: full JSON-serialized AG-UI event
+
+    When a shared ``batcher`` is given, XADDs are queued and pipelined with
+    other streams' events instead of costing one round-trip each.  The
+    transport keeps the futures of its own queued entries: failed writes
+    are logged with the event they carried (sending carries on, as with
+    direct XADDs) and ``close`` waits for exactly this stream's entries.
     """
 
     def __init__(
@@ -61,12 +73,16 @@ class RedisStreamTransport:
         *,
         ttl_seconds: int = DEFAULT_STREAM_TTL_SECONDS,
         max_stream_length: int = 10000,
+        batcher: RedisStreamBatcher | None = None,
     ) -> None:
         self._redis = redis
         self._session_id = session_id
         self._key = stream_key(session_id)
         self._ttl_seconds = ttl_seconds
         self._max_len = max_stream_length
+        self._batcher = batcher
+        self._pending: deque[tuple[EventType, asyncio.Future[None]]] = deque()
+        self._failed_writes = 0
 
     @property
     def key(self) -> str:
@@ -75,21 +91,37 @@ class RedisStreamTransport:
 
     async def send(self, event: BaseEvent) -> None:
         """Publish an AG-UI event to the Redis Stream."""
+        fields: dict[str, str | bytes] = {
+            "type": event.type.value,
+            "data": event_json(event),
+        }
         try:
-            await self._redis.xadd(
-                self._key,
-                {
-                    "type": event.type.value,
-                    "data": event.model_dump_json(by_alias=True, exclude_none=True),
-                },
-                maxlen=self._max_len,
-            )
+            if self._batcher is not None:
+                written = await self._batcher.submit(self._key, fields, maxlen=self._max_len)
+                self._pending.append((event.type, written))
+            else:
+                await self._redis.xadd(self._key, fields, maxlen=self._max_len)  # type: ignore[arg-type]
         except Exception:
             logger.exception(
                 "Failed to XADD event %s to stream %s",
                 event.type,
                 self._key,
             )
+        self._collect_written()
+
+    def _collect_written(self) -> None:
+        """Drop settled batched entries, logging the ones that failed."""
+        while self._pending and self._pending[0][1].done():
+            event_type, written = self._pending.popleft()
+            error = written.exception()
+            if error is not None:
+                self._failed_writes += 1
+                logger.error(
+                    "Failed to XADD event %s to stream %s",
+                    event_type,
+                    self._key,
+                    exc_info=error,
+                )
 
     async def close(self) -> None:
         """Set TTL on the stream after execution completes.
@@ -98,6 +130,12 @@ class RedisStreamTransport:
         must read events before expiry or use the PG session index for
         completed sessions.
         """
+        if self._pending:
+            # Our queued XADDs must land before the TTL is set on the key.
+            await asyncio.wait([written for _, written in self._pending])
+            self._collect_written()
+        if self._failed_writes:
+            logger.error("Failed to XADD %d batched events to stream %s", self._failed_writes, self._key)
         try:
             await self._redis.expire(self._key, self._ttl_seconds)
             logger.debug(
@@ -13,6 +13,7 @@ from netherbrain.agent_runtime.app import app
 from netherbrain.agent_runtime.db.tables import User
 from netherbrain.agent_runtime.deps import get_db
 from netherbrain.agent_runtime.managers.execution import ExecutionManager
+from netherbrain.agent_runtime.managers.presets import invalidate_preset_cache
 from netherbrain.agent_runtime.managers.sessions import SessionManager
 from netherbrain.agent_runtime.middleware import BOOTSTRAP_ADMIN_ID
 from netherbrain.agent_runtime.registry import SessionRegistry
@@ -22,6 +23,12 @@ from netherbrain.agent_runtime.store.local import LocalStateStore
 TEST_AUTH_TOKEN = "test-token-for-integration"  # noqa: S105
 
 
+@pytest.fixture(autouse=True)
+def _fresh_preset_cache() -> None:
+    """Tests reuse preset IDs with different rows; never serve a previous test's preset."""
+    invalidate_preset_cache()
+
+
 @pytest.fixture
 async def test_user(db_session: AsyncSession) -> User:
     """Create the bootstrap admin user required by FK constraints.
@@ -68,11 +75,13 @@ async def client(
 
     # Pre-set state fields (lifespan does not run under ASGITransport).
     app.state.auth_token = TEST_AUTH_TOKEN
+    app.state.auth_token_bytes = TEST_AUTH_TOKEN.encode()
     app.state.jwt_secret = "test-jwt-secret-for-integration-32bytes!"  # noqa: S105
     app.state.jwt_expiry_days = 7
     app.state.db_engine = None
     app.state.db_session_factory = None
     app.state.redis = None
+    app.state.redis_pipeline = None
     from netherbrain.agent_runtime.managers.shell import ShellRegistry
 
     app.state.shell_registry = ShellRegistry()
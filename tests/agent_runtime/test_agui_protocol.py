@@ -52,7 +52,7 @@ from netherbrain.agent_runtime.execution.events import (
     PipelineUsage,
     UsageSnapshot,
 )
-from netherbrain.agent_runtime.models.events import ExtensionEvent
+from netherbrain.agent_runtime.models.events import ExtensionEvent, encode_sse, event_json
 from netherbrain.agent_runtime.streaming.protocols.agui import (
     TOOL_STATUS_CANCEL,
     TOOL_STATUS_COMPLETE,
@@ -938,3 +938,16 @@ async def test_reset_for_new_message() -> None:
     assert not adapter._text_open
     assert not adapter._reasoning_open
     assert not adapter._reasoning_msg_open
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def test_event_json_matches_model_dump_json() -> None:
+    evt = ToolCallResultEvent(message_id="m1", tool_call_id="tc1", content="ok")
+    expected = evt.model_dump_json(by_alias=True, exclude_none=True)
+
+    assert event_json(evt) == expected.encode()
+    assert encode_sse(evt, sse_id="e1") == {"id": "e1", "data": expected}
@@ -29,6 +29,7 @@ async def auth_client(db_session: AsyncSession, tmp_path: object) -> AsyncIterat
 
     app.dependency_overrides[get_db] = _override_get_db
     app.state.auth_token = AUTH_TOKEN
+    app.state.auth_token_bytes = AUTH_TOKEN.encode()
     app.state.jwt_secret = JWT_SECRET
     app.state.jwt_expiry_days = 7
     app.state.db_engine = None
@@ -130,6 +131,7 @@ async def noauth_client(db_session: AsyncSession, tmp_path: object) -> AsyncIter
 
     app.dependency_overrides[get_db] = _override_get_db
     app.state.auth_token = None
+    app.state.auth_token_bytes = None
     app.state.jwt_secret = None
     app.state.jwt_expiry_days = 7
     app.state.db_engine = None
@@ -0,0 +1,52 @@
+"""Tests for the Redis Stream -> SSE bridge."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from netherbrain.agent_runtime.transport.bridge import bridge_stream_to_sse
+
+
+async def test_bridge_stops_when_shutdown_is_set() -> None:
+    shutdown = asyncio.Event()
+    redis = AsyncMock()
+    redis.exists.return_value = True
+
+    async def _xread(*_args: object, **_kwargs: object) -> list:
+        shutdown.set()
+        return []
+
+    redis.xread.side_effect = _xread
+
+    events = [e async for e in bridge_stream_to_sse(redis, "s1", shutdown=shutdown)]
+
+    assert events == []
+    assert redis.xread.await_count == 1
+
+
+async def test_bridge_shutdown_interrupts_blocking_read() -> None:
+    shutdown = asyncio.Event()
+    redis = AsyncMock()
+    redis.exists.return_value = True
+    cancelled = asyncio.Event()
+
+    async def _xread(*_args: object, **_kwargs: object) -> list:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    redis.xread.side_effect = _xread
+    asyncio.get_running_loop().call_later(0.01, shutdown.set)
+
+    events = await asyncio.wait_for(_collect(bridge_stream_to_sse(redis, "s1", shutdown=shutdown)), timeout=1)
+
+    assert events == []
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+async def _collect(stream) -> list:
+    return [e async for e in stream]
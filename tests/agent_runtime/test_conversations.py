@@ -7,6 +7,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from netherbrain.agent_runtime.db.tables import Conversation
+from netherbrain.agent_runtime.models.api import ConversationDetailResponse
 
 
 @pytest.mark.integration
@@ -76,3 +77,16 @@ async def test_conversation_filter_by_metadata(client: AsyncClient, db_session:
     data = resp.json()
     assert len(data) == 1
     assert data[0]["conversation_id"] == "c-discord"
+
+
+def test_detail_response_schema_built_at_import() -> None:
+    assert ConversationDetailResponse.__pydantic_complete__
+
+
+@pytest.mark.integration
+async def test_conversation_list_unknown_cursor(client: AsyncClient) -> None:
+    resp = await client.get("/api/conversations/list", params={"before": "gone"})
+    assert resp.status_code == 404
+
+    resp = await client.get("/api/conversations/list", params={"before": "gone", "offset": 5})
+    assert resp.status_code == 422
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,6 +23,7 @@ from netherbrain.agent_runtime.execution.coordinator import (
     _handle_interrupt,
     _pipeline_usage_to_summary,
     _restore_parent_state,
+    _serialize_messages,
     build_deferred_tool_results,
 )
 from netherbrain.agent_runtime.models.enums import SessionStatus
@@ -60,7 +62,7 @@ def _mock_runtime(*, extra_usages: list | None = None) -> MagicMock:
     """Create a mock AgentRuntime with configurable extra usages."""
     runtime = MagicMock()
     runtime.ctx.extra_usages = extra_usages or []
-    runtime.ctx.export_state.return_value = MagicMock(model_dump=lambda: {})
+    runtime.ctx.export_state.return_value = MagicMock(model_dump=lambda **_: {})
     runtime.env.export_resource_state = AsyncMock(return_value=None)
     return runtime
 
@@ -107,27 +109,27 @@ def test_get_output_result_raises() -> None:
 
 def test_extract_final_message_string() -> None:
     streamer = _mock_streamer(output="Final answer")
-    assert _extract_final_message(streamer) == "Final answer"
+    assert _extract_final_message(_get_output(streamer)) == "Final answer"
 
 
 def test_extract_final_message_deferred() -> None:
     streamer = _mock_streamer(output=DeferredToolRequests())
-    assert _extract_final_message(streamer) is None
+    assert _extract_final_message(_get_output(streamer)) is None
 
 
 def test_extract_final_message_no_run() -> None:
     streamer = _mock_streamer(has_run=False)
-    assert _extract_final_message(streamer) is None
+    assert _extract_final_message(_get_output(streamer)) is None
 
 
 def test_extract_final_message_non_string() -> None:
     streamer = _mock_streamer(output=42)
-    assert _extract_final_message(streamer) == "42"
+    assert _extract_final_message(_get_output(streamer)) == "42"
 
 
 def test_extract_final_message_none_output() -> None:
     streamer = _mock_streamer(output=None)
-    assert _extract_final_message(streamer) is None
+    assert _extract_final_message(_get_output(streamer)) is None
 
 
 # ---------------------------------------------------------------------------
@@ -137,17 +139,17 @@ def test_extract_final_message_none_output() -> None:
 
 def test_check_deferred_true() -> None:
     streamer = _mock_streamer(output=DeferredToolRequests())
-    assert _check_deferred(streamer) is True
+    assert _check_deferred(_get_output(streamer)) is True
 
 
 def test_check_deferred_false() -> None:
     streamer = _mock_streamer(output="Done")
-    assert _check_deferred(streamer) is False
+    assert _check_deferred(_get_output(streamer)) is False
 
 
 def test_check_deferred_no_run() -> None:
     streamer = _mock_streamer(has_run=False)
-    assert _check_deferred(streamer) is False
+    assert _check_deferred(_get_output(streamer)) is False
 
 
 # ---------------------------------------------------------------------------
@@ -403,6 +405,45 @@ def test_restore_parent_state_with_context() -> None:
     assert resource is None
 
 
+def test_restore_parent_state_matches_validation() -> None:
+    """Trusted construction yields the same objects as full validation."""
+    from pydantic_ai.messages import ImageUrl
+    from pydantic_ai.usage import RunUsage
+    from y_agent_environment.resources import ResourceEntry, ResourceRegistryState
+    from ya_agent_sdk.context import ResumableState
+    from ya_agent_sdk.usage import ExtraUsageRecord
+
+    context = ResumableState(
+        subagent_history={"explorer": [{"kind": "request", "parts": [{"content": "hi"}]}]},
+        extra_usages=[ExtraUsageRecord(uuid="u1", agent="explorer", model_id="m", usage=RunUsage(input_tokens=3))],
+        user_prompts=["look at this", ImageUrl(url="https://example.com/a.png")],
+        deferred_tool_metadata={"tc1": {"type": "approval"}},
+    ).model_dump(mode="json")
+    environment = ResourceRegistryState(entries={"shell": ResourceEntry(state={"cwd": "/workspace"})}).model_dump(
+        mode="json"
+    )
+    state = SessionState(context_state=context, message_history=[], environment_state=environment)
+
+    resumable, resource = _restore_parent_state(state)
+
+    assert resumable == ResumableState.model_validate(context)
+    assert isinstance(resumable.extra_usages[0].usage, RunUsage)
+    assert isinstance(resumable.user_prompts[1], ImageUrl)
+    assert resource == ResourceRegistryState.model_validate(environment)
+
+
+def test_serialize_messages_matches_type_adapter() -> None:
+    from pydantic_ai.messages import ModelMessagesTypeAdapter, ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+    messages = [
+        ModelRequest(parts=[UserPromptPart(content="hi")]),
+        ModelResponse(parts=[TextPart(content="hello")]),
+    ]
+
+    assert _serialize_messages(messages) == ModelMessagesTypeAdapter.dump_python(messages, mode="json")
+    assert _serialize_messages([]) == []
+
+
 # ---------------------------------------------------------------------------
 # _handle_interrupt
 # ---------------------------------------------------------------------------
@@ -511,7 +552,7 @@ async def test_execute_session_success(
     mock_map_input.return_value = "Hello"
 
     mock_runtime = MagicMock()
-    mock_runtime.ctx.export_state.return_value = MagicMock(model_dump=lambda: {})
+    mock_runtime.ctx.export_state.return_value = MagicMock(model_dump=lambda **_: {})
     mock_runtime.ctx.extra_usages = []
     mock_runtime.env.export_resource_state = AsyncMock(return_value=None)
 
@@ -568,6 +609,71 @@ async def test_execute_session_success(
     mock_registry.register.assert_called_once()
 
 
+@pytest.mark.anyio
+@patch("netherbrain.agent_runtime.execution.coordinator.create_service_runtime")
+@patch("netherbrain.agent_runtime.execution.coordinator.map_input_to_prompt")
+async def test_execute_session_posts_mailbox_before_terminal_event(
+    mock_map_input: AsyncMock,
+    mock_create_runtime: MagicMock,
+    tmp_path: Any,
+) -> None:
+    """A subagent's mailbox entry exists before its completion event is sent."""
+    from netherbrain.agent_runtime.execution.coordinator import execute_session
+    from netherbrain.agent_runtime.models.input import text_part
+
+    mock_map_input.return_value = "Hello"
+    mock_runtime = MagicMock()
+    mock_runtime.ctx.export_state.return_value = MagicMock(model_dump=lambda **_: {})
+    mock_runtime.ctx.extra_usages = []
+    mock_runtime.env.export_resource_state = AsyncMock(return_value=None)
+    mock_create_runtime.return_value = (mock_runtime, MagicMock())
+
+    mock_settings = MagicMock()
+    mock_settings.data_root = str(tmp_path)
+    mock_settings.data_prefix = None
+
+    calls: list[str] = []
+    event_transport = AsyncMock()
+    event_transport.send.side_effect = lambda _event: calls.append("send")
+
+    async def _post_mailbox(*_args: Any, **_kwargs: Any) -> None:
+        await asyncio.sleep(0.01)  # a DB round-trip
+        calls.append("mailbox")
+
+    # Only record what happens after the commit.
+    session_manager = AsyncMock()
+    session_manager.commit_session.side_effect = lambda *_args, **_kwargs: calls.clear()
+
+    mock_streamer = _mock_streamer(output="Done!")
+    mock_streamer.__aiter__ = MagicMock(return_value=mock_streamer)
+    mock_streamer.__anext__ = AsyncMock(side_effect=StopAsyncIteration)
+    cm = AsyncMock()
+    cm.__aenter__ = AsyncMock(return_value=mock_streamer)
+    cm.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("netherbrain.agent_runtime.execution.coordinator.stream_agent", return_value=cm),
+        patch("netherbrain.agent_runtime.execution.coordinator._post_mailbox_if_subagent", _post_mailbox),
+    ):
+        result = await execute_session(
+            _make_config(),
+            [text_part("Hello")],
+            session_id="sess-1",
+            conversation_id="conv-1",
+            session_manager=session_manager,
+            registry=MagicMock(),
+            settings=mock_settings,
+            db=AsyncMock(),
+            event_transport=event_transport,
+            subagent_name="helper",
+        )
+
+    assert result.status == SessionStatus.COMMITTED
+    assert calls[0] == "mailbox"
+    assert calls[1:] and set(calls[1:]) == {"send"}
+    event_transport.close.assert_awaited_once()
+
+
 @pytest.mark.anyio
 @patch("netherbrain.agent_runtime.execution.coordinator.create_service_runtime")
 @patch("netherbrain.agent_runtime.execution.coordinator.map_input_to_prompt")
@@ -609,3 +715,58 @@ async def test_execute_session_failure(
 
     assert result.status == SessionStatus.FAILED
     mock_session_manager.fail_session.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# _EventPump
+# ---------------------------------------------------------------------------
+
+
+class _RecordingAdapter:
+    def __init__(self, fail_on: int | None = None) -> None:
+        self.fail_on = fail_on
+
+    async def on_event(self, event: Any):
+        if event == self.fail_on:
+            raise ValueError
+        yield event
+
+
+async def test_event_pump_delivers_in_order() -> None:
+    from netherbrain.agent_runtime.execution.coordinator import _EventPump
+
+    transport = AsyncMock()
+    pump = _EventPump(_RecordingAdapter(), transport)  # type: ignore[arg-type]
+    for i in range(50):
+        await pump.put(i)  # type: ignore[arg-type]
+    await pump.drain()
+
+    assert [c.args[0] for c in transport.send.await_args_list] == list(range(50))
+
+
+async def test_event_pump_reraises_adapter_error_on_drain() -> None:
+    from netherbrain.agent_runtime.execution.coordinator import _EventPump
+
+    transport = AsyncMock()
+    pump = _EventPump(_RecordingAdapter(fail_on=2), transport)  # type: ignore[arg-type]
+    for i in range(5):
+        await pump.put(i)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        await pump.drain()
+    assert [c.args[0] for c in transport.send.await_args_list] == [0, 1]
+
+
+async def test_event_pump_put_raises_after_delivery_error() -> None:
+    from netherbrain.agent_runtime.execution.coordinator import _EventPump
+
+    transport = AsyncMock()
+    pump = _EventPump(_RecordingAdapter(fail_on=0), transport)  # type: ignore[arg-type]
+    await pump.put(0)  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ValueError):
+        await pump.put(1)  # type: ignore[arg-type]
+    # A caller already propagating an exception keeps it.
+    await pump.drain(reraise=False)
+    transport.send.assert_not_awaited()
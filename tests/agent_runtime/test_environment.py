@@ -12,6 +12,7 @@ from netherbrain.agent_runtime.execution.environment import (
     DEFAULT_CONTAINER_WORKDIR,
     ProjectPaths,
     create_environment,
+    resolve_project_paths,
 )
 from netherbrain.agent_runtime.execution.resolver import ResolvedConfig
 from netherbrain.agent_runtime.models.enums import EnvironmentMode
@@ -140,6 +141,35 @@ def test_ensure_directories(tmp_path: Path) -> None:
     paths.ensure_directories()
 
 
+async def test_ensure_directories_async(tmp_path: Path) -> None:
+    paths = ProjectPaths(
+        data_root=tmp_path,
+        prefix=None,
+        project_ids=["alpha", "beta", "gamma"],
+    )
+    (tmp_path / "projects" / "beta").mkdir(parents=True)
+
+    await paths.ensure_directories_async()
+
+    for pid in ("alpha", "beta", "gamma"):
+        assert (tmp_path / "projects" / pid).is_dir()
+
+    # Idempotent: calling again should not raise.
+    await paths.ensure_directories_async()
+
+
+async def test_ensure_directories_recreates_removed_directory(tmp_path: Path) -> None:
+    paths = ProjectPaths(data_root=tmp_path, prefix=None, project_ids=["alpha"])
+    await paths.ensure_directories_async()
+
+    # Instances are shared across sessions; a directory removed in between
+    # must be recreated on the next call.
+    (tmp_path / "projects" / "alpha").rmdir()
+    await paths.ensure_directories_async()
+
+    assert (tmp_path / "projects" / "alpha").is_dir()
+
+
 def test_ensure_directories_with_prefix(tmp_path: Path) -> None:
     paths = ProjectPaths(
         data_root=tmp_path,
@@ -152,6 +182,17 @@ def test_ensure_directories_with_prefix(tmp_path: Path) -> None:
     assert (tmp_path / "tenant-x" / "projects" / "proj").is_dir()
 
 
+def test_resolve_project_paths_shared_per_layout(tmp_path: Path) -> None:
+    settings = _make_settings(tmp_path)
+
+    paths = resolve_project_paths(_make_config(project_ids=["a", "b"]), settings)
+
+    assert resolve_project_paths(_make_config(project_ids=["a", "b"]), settings) is paths
+    assert resolve_project_paths(_make_config(project_ids=["b", "a"]), settings) is not paths
+    assert paths.project_ids == ("a", "b")
+    assert paths.extra_project_ids == ["b"]
+
+
 # ---------------------------------------------------------------------------
 # create_environment factory tests
 # ---------------------------------------------------------------------------
@@ -29,3 +29,10 @@ async def test_health_reports_infrastructure_status(client: AsyncClient) -> None
     assert data["postgres"] == "unavailable"
     assert data["redis"] == "unavailable"
     assert data["status"] == "ok"  # unavailable != error
+
+
+@pytest.mark.integration
+async def test_ready_no_auth_required(client: AsyncClient) -> None:
+    resp = await client.request("GET", "/api/ready", headers={})
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ready"}
@@ -10,6 +10,7 @@ import json as _json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import pytest
 from ya_agent_sdk.context import ToolConfig
 
 from netherbrain.agent_runtime.toolsets.common import get_nether_config
@@ -303,3 +304,14 @@ def test_resolve_tool_config_no_extras() -> None:
     spec = ToolConfigSpec()
     tc = resolve_tool_config(spec)
     assert not hasattr(tc, "nether_api_base_url")
+
+
+def test_resolve_tool_config_reads_api_keys_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    from netherbrain.agent_runtime.execution.runtime import resolve_tool_config
+    from netherbrain.agent_runtime.models.preset import ToolConfigSpec
+
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+    tc = resolve_tool_config(ToolConfigSpec(image_understanding_model="openai:gpt-4o"))
+    assert tc.tavily_api_key == "tvly-test"
+    assert tc.image_understanding_model == "openai:gpt-4o"
+    assert tc.video_understanding_model is None
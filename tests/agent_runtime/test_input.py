@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import binascii
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 from pydantic_ai.messages import AudioUrl, BinaryContent, DocumentUrl, ImageUrl, VideoUrl
 from ya_agent_sdk.environment.local import LocalFileOperator
@@ -13,10 +17,16 @@ from ya_agent_sdk.environment.local import LocalFileOperator
 from netherbrain.agent_runtime.execution.input import (
     _MAX_DOWNLOAD_BYTES,
     _MAX_INLINE_BYTES,
+    _THREADED_DECODE_CHARS,
     _classify_mime,
+    _decode_base64,
+    _guess_extension,
+    _guess_mime,
     _resolve_file_path,
+    _shared_http,
     _url_to_inline_content,
     _write_binary,
+    close_http_client,
     map_input_to_prompt,
 )
 from netherbrain.agent_runtime.models.enums import InputPartType, StorageMode
@@ -162,6 +172,8 @@ def test_tool_result_with_error() -> None:
         ("application/zip", "binary"),
         (None, "binary"),
         ("image/png; charset=utf-8", "image"),
+        ("TEXT/X-Python", "document"),
+        ("image", "binary"),
     ],
 )
 def test_classify_mime(mime: str | None, expected: str) -> None:
@@ -173,6 +185,19 @@ def test_classify_mime(mime: str | None, expected: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+def test_guess_mime_ignores_query_and_case() -> None:
+    assert _guess_mime("https://x.com/a/photo.JPG?size=large#top") == "image/jpeg"
+    assert _guess_mime("notes.md") == "text/markdown"
+    assert _guess_mime("archive.tar.gz") == "application/x-tar"  # falls back to mimetypes
+    assert _guess_mime("README") is None
+
+
+def test_guess_extension() -> None:
+    assert _guess_extension("image/jpeg") == ".jpg"
+    assert _guess_extension("audio/wav") == ".wav"
+    assert _guess_extension("application/zip") == ".zip"  # falls back to mimetypes
+
+
 def test_url_to_inline_image() -> None:
     result = _url_to_inline_content("https://x.com/photo.jpg", "image/jpeg")
     assert isinstance(result, ImageUrl)
@@ -236,7 +261,7 @@ def _mock_stream_client(
     response.raise_for_status = MagicMock()
     response.headers = hdrs
 
-    async def aiter_bytes():
+    async def aiter_bytes(chunk_size: int | None = None):
         yield content
 
     response.aiter_bytes = aiter_bytes
@@ -270,6 +295,12 @@ def test_resolve_file_path_leading_dot_slash() -> None:
     assert result == "src/main.py"
 
 
+def test_resolve_file_path_keeps_dotfiles() -> None:
+    assert _resolve_file_path("/./.env") == ".env"
+    assert _resolve_file_path(".github/workflows/ci.yml") == ".github/workflows/ci.yml"
+    assert _resolve_file_path("../outside.txt") == "../outside.txt"
+
+
 @pytest.mark.anyio
 async def test_write_binary(tmp_path: Path) -> None:
     file_op = _make_file_operator(tmp_path)
@@ -333,6 +364,16 @@ async def test_map_inline_binary() -> None:
     assert result[0].data == raw
 
 
+@pytest.mark.anyio
+async def test_decode_base64_small_and_large() -> None:
+    small = b"tiny"
+    large = b"y" * (_THREADED_DECODE_CHARS)
+    assert await _decode_base64(base64.b64encode(small).decode()) == small
+    assert await _decode_base64(base64.b64encode(large).decode()) == large
+    with pytest.raises(binascii.Error):
+        await _decode_base64("not base64!" * _THREADED_DECODE_CHARS)
+
+
 @pytest.mark.anyio
 async def test_map_file_mode_file_part(tmp_path: Path) -> None:
     file_op = _make_file_operator(tmp_path)
@@ -402,6 +443,60 @@ async def test_map_file_mode_url_downloads(tmp_path: Path) -> None:
     assert files[0].read_bytes() == b"downloaded content"
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("url", "suffix"),
+    [
+        ("https://example.com/docs/report.pdf?dl=1", "-report.pdf"),
+        ("https://example.com/docs/", "-docs"),
+        ("https://example.com", "-download"),
+        ("https://example.com/a/..", "-download"),
+    ],
+)
+async def test_download_filename_from_url_path(tmp_path: Path, url: str, suffix: str) -> None:
+    file_op = _make_file_operator(tmp_path)
+
+    await map_input_to_prompt([url_part(url)], file_op, http_client=_mock_stream_client(b"x"))
+
+    (saved,) = (tmp_path / ".agent_tmp").iterdir()
+    assert saved.name.endswith(suffix)
+    assert len(saved.name) == 8 + len(suffix)
+
+
+@pytest.mark.anyio
+async def test_map_url_downloads_run_concurrently_in_order(tmp_path: Path) -> None:
+    file_op = _make_file_operator(tmp_path)
+    in_flight = 0
+    peak = 0
+
+    def _stream(_method: str, url: str, **_kwargs: object) -> MagicMock:
+        response = MagicMock()
+        response.headers = {"content-type": "text/plain"}
+
+        async def aiter_bytes(chunk_size: int | None = None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            yield url.encode()
+
+        response.aiter_bytes = aiter_bytes
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=response)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        return cm
+
+    client = MagicMock()
+    client.stream = MagicMock(side_effect=_stream)
+
+    parts = [url_part(f"https://example.com/{i}.txt") for i in range(3)]
+    result = await map_input_to_prompt(parts, file_op, http_client=client)
+
+    assert peak == 3
+    assert [f"Source: https://example.com/{i}.txt" in r for i, r in enumerate(result)] == [True] * 3
+
+
 @pytest.mark.anyio
 async def test_map_persistent_url_downloads_to_project_dir(tmp_path: Path) -> None:
     file_op = _make_file_operator(tmp_path)
@@ -529,6 +624,8 @@ async def test_download_rejects_oversized_stream(tmp_path: Path) -> None:
     result = await map_input_to_prompt(parts, file_op, http_client=mock_client)
     assert isinstance(result, list)
     assert isinstance(result[0], DocumentUrl)  # inline fallback
+    # The partially streamed file is removed.
+    assert list((tmp_path / ".agent_tmp").iterdir()) == []
 
 
 @pytest.mark.anyio
@@ -555,3 +652,57 @@ async def test_inline_file_rejects_oversized(tmp_path: Path) -> None:
     parts = [file_part("big.bin", storage=StorageMode.INLINE)]
     with pytest.raises(ValueError, match="too large for inline"):
         await map_input_to_prompt(parts, file_op)
+
+
+@pytest.mark.anyio
+async def test_shared_http_client_reused_until_closed() -> None:
+    client = _shared_http.get()
+    assert _shared_http.get() is client
+
+    await close_http_client()
+
+    assert client.is_closed
+    replacement = _shared_http.get()
+    assert replacement is not client
+    await close_http_client()
+
+
+async def _get_shared_client() -> httpx.AsyncClient:
+    return _shared_http.get()
+
+
+@pytest.mark.anyio
+async def test_shared_http_client_closes_client_of_stopped_loop() -> None:
+    other = asyncio.new_event_loop()
+    try:
+        stale = await asyncio.to_thread(other.run_until_complete, _get_shared_client())
+
+        replacement = _shared_http.get()
+
+        assert replacement is not stale
+        assert stale.is_closed
+    finally:
+        other.close()
+        await close_http_client()
+
+
+@pytest.mark.anyio
+async def test_shared_http_client_closes_client_of_running_loop() -> None:
+    other = asyncio.new_event_loop()
+    runner = threading.Thread(target=other.run_forever)
+    runner.start()
+    try:
+        stale = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_get_shared_client(), other))
+
+        _shared_http.get()
+        for _ in range(100):
+            if stale.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        assert stale.is_closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        runner.join()
+        other.close()
+        await close_http_client()
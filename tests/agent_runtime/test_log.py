@@ -0,0 +1,23 @@
+"""Tests for logging setup."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from netherbrain.agent_runtime.log import _stdlib_level
+
+
+@pytest.mark.parametrize(
+    ("level", "expected"),
+    [
+        ("DEBUG", logging.DEBUG),
+        ("INFO", logging.INFO),
+        ("WARNING", logging.WARNING),
+        ("TRACE", logging.NOTSET),
+        ("SUCCESS", logging.NOTSET),
+    ],
+)
+def test_stdlib_level(level: str, expected: int) -> None:
+    assert _stdlib_level(level) == expected
@@ -5,6 +5,9 @@ from __future__ import annotations
 import pytest
 from httpx import AsyncClient
 
+from netherbrain.agent_runtime.managers.presets import _to_row_kwargs
+from netherbrain.agent_runtime.models.api import PresetCreate, PresetUpdate
+
 PRESET_PAYLOAD = {
     "name": "Test Preset",
     "model": {"name": "anthropic:claude-sonnet-4"},
@@ -12,6 +15,20 @@ PRESET_PAYLOAD = {
 }
 
 
+def test_to_row_kwargs_dumps_nested_models_to_plain_values() -> None:
+    body = PresetCreate(**PRESET_PAYLOAD, toolsets=[{"toolset_name": "core"}])
+
+    row = _to_row_kwargs(body, exclude={"preset_id"})
+
+    assert row["model"]["name"] == "anthropic:claude-sonnet-4"
+    assert row["toolsets"] == [{"toolset_name": "core", "enabled": True, "exclude_tools": []}]
+    assert type(row["environment"]) is dict
+    assert "preset_id" not in row
+    assert _to_row_kwargs(PresetUpdate(environment={"mode": "local"}), exclude_unset=True) == {
+        "environment": {"mode": "local"}
+    }
+
+
 @pytest.mark.integration
 async def test_create_preset(client: AsyncClient) -> None:
     resp = await client.post("/api/presets/create", json=PRESET_PAYLOAD)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from netherbrain.agent_runtime.execution.prompt import render_system_prompt
+import pytest
+
+from netherbrain.agent_runtime.execution import prompt
+from netherbrain.agent_runtime.execution.prompt import _compile, _UtcDate, render_system_prompt
 from netherbrain.agent_runtime.execution.resolver import ResolvedConfig
 from netherbrain.agent_runtime.models.enums import EnvironmentMode
 from netherbrain.agent_runtime.models.preset import ModelPreset, SubagentSpec
@@ -98,6 +101,18 @@ def test_template_date() -> None:
     assert len(result.split(": ")[1]) == 10
 
 
+def test_utc_date_rolls_over_at_midnight(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1_767_225_599.5]  # 2025-12-31T23:59:59.5Z
+    monkeypatch.setattr(prompt.time, "time", lambda: clock[0])
+    today = _UtcDate()
+
+    assert today.get() == "2025-12-31"
+    clock[0] += 0.4
+    assert today.get() == "2025-12-31"
+    clock[0] += 0.1
+    assert today.get() == "2026-01-01"
+
+
 def test_extra_vars() -> None:
     config = _make_config(
         system_prompt="User: {{ username }}",
@@ -120,3 +135,14 @@ def test_no_jinja_syntax_fast_path() -> None:
     config = _make_config(system_prompt="Plain prompt with { braces } but not Jinja.")
     result = render_system_prompt(config)
     assert result == "Plain prompt with { braces } but not Jinja."
+
+
+def test_template_compiled_once_per_source() -> None:
+    config = _make_config(system_prompt="Preset {{ preset_id }} on {{ default_project }}.")
+    render_system_prompt(config)
+    hits = _compile.cache_info().hits
+
+    result = render_system_prompt(_make_config(system_prompt=config.system_prompt, project_ids=["other"]))
+
+    assert result == "Preset test-preset on other."
+    assert _compile.cache_info().hits == hits + 1
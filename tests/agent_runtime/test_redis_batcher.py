@@ -0,0 +1,153 @@
+"""Tests for the pipelined Redis Stream XADD batcher."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ag_ui.core import EventType, TextMessageContentEvent
+
+from netherbrain.agent_runtime.models.events import event_json
+from netherbrain.agent_runtime.transport.redis_batcher import RedisStreamBatcher
+from netherbrain.agent_runtime.transport.redis_stream import RedisStreamTransport, stream_key
+
+
+class _FakePipeline:
+    def __init__(self, sink: list[list[tuple[str, dict]]], error: Exception | None = None) -> None:
+        self._sink = sink
+        self._error = error
+        self._calls: list[tuple[str, dict]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def xadd(self, key: str, fields: dict, maxlen: int | None = None) -> None:
+        self._calls.append((key, fields))
+
+    async def execute(self, raise_on_error: bool = True) -> list[bytes]:
+        if self._error is not None:
+            raise self._error
+        self._sink.append(self._calls)
+        return [b"0-0"] * len(self._calls)
+
+
+def _fake_redis(error: Exception | None = None) -> tuple[MagicMock, list[list[tuple[str, dict]]]]:
+    batches: list[list[tuple[str, dict]]] = []
+    redis = MagicMock()
+    redis.pipeline.side_effect = lambda transaction=True: _FakePipeline(batches, error)
+    redis.xadd = AsyncMock()
+    redis.expire = AsyncMock()
+    return redis, batches
+
+
+def _event(delta: str) -> TextMessageContentEvent:
+    return TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m", delta=delta)
+
+
+async def test_batcher_coalesces_and_preserves_order() -> None:
+    redis, batches = _fake_redis()
+    batcher = RedisStreamBatcher(redis, max_batch=4)
+    batcher.start()
+    try:
+        written = [await batcher.submit("k", {"i": str(i)}) for i in range(10)]
+        await asyncio.gather(*written)
+    finally:
+        await batcher.stop()
+
+    flat = [fields["i"] for batch in batches for _, fields in batch]
+    assert flat == [str(i) for i in range(10)]
+    assert all(len(batch) <= 4 for batch in batches)
+    assert len(batches) < 10
+
+
+async def test_batcher_stop_drains_pending() -> None:
+    redis, batches = _fake_redis()
+    batcher = RedisStreamBatcher(redis)
+    batcher.start()
+    await batcher.submit("k", {"i": "0"})
+    await batcher.stop()
+
+    assert sum(len(b) for b in batches) == 1
+    assert not batcher.running
+
+
+async def test_batcher_writes_directly_after_stop() -> None:
+    redis, batches = _fake_redis()
+    batcher = RedisStreamBatcher(redis)
+    batcher.start()
+    await batcher.stop()
+
+    transport = RedisStreamTransport(redis, "s1", batcher=batcher)
+    await transport.send(_event("late"))
+    await transport.close()
+
+    assert batches == []
+    redis.xadd.assert_awaited_once()
+    redis.expire.assert_awaited_once()
+
+
+async def test_transport_close_waits_only_for_own_entries() -> None:
+    redis, _ = _fake_redis()
+    blocked = asyncio.Event()
+
+    class _StuckPipeline(_FakePipeline):
+        async def execute(self, raise_on_error: bool = True) -> list[bytes]:
+            if any(key == "other" for key, _ in self._calls):
+                await blocked.wait()
+            return await super().execute(raise_on_error)
+
+    redis.pipeline.side_effect = lambda transaction=True: _StuckPipeline([])
+    batcher = RedisStreamBatcher(redis, max_batch=1, max_delay=0)
+    batcher.start()
+    transport = RedisStreamTransport(redis, "s1", batcher=batcher)
+    await transport.send(_event("a"))
+    # Another session's entry stays in flight; our close must not wait for it.
+    other = await batcher.submit("other", {"i": "0"})
+    await asyncio.wait_for(transport.close(), timeout=1)
+    assert not other.done()
+
+    blocked.set()
+    await batcher.stop()
+    assert other.done()
+
+
+async def test_transport_keeps_sending_after_pipeline_failure(caplog: pytest.LogCaptureFixture) -> None:
+    redis, batches = _fake_redis()
+    pipelines = [_FakePipeline(batches, ConnectionError("redis down"))]
+    redis.pipeline.side_effect = lambda transaction=True: pipelines.pop() if pipelines else _FakePipeline(batches)
+    batcher = RedisStreamBatcher(redis, max_delay=0)
+    batcher.start()
+    try:
+        transport = RedisStreamTransport(redis, "s1", batcher=batcher)
+        await transport.send(_event("a"))
+        await asyncio.sleep(0.01)
+        await transport.send(_event("b"))  # must not raise or be dropped
+        with caplog.at_level("ERROR"):
+            await transport.close()
+    finally:
+        await batcher.stop()
+
+    assert [fields["data"] for batch in batches for _, fields in batch] == [event_json(_event("b"))]
+    assert "Failed to XADD 1 batched events" in caplog.text
+
+
+@pytest.mark.integration
+async def test_transport_with_batcher_writes_stream(redis_client) -> None:
+    batcher = RedisStreamBatcher(redis_client)
+    batcher.start()
+    try:
+        transport = RedisStreamTransport(redis_client, "batched-session", batcher=batcher)
+        for i in range(20):
+            await transport.send(_event(str(i)))
+        await transport.close()
+    finally:
+        await batcher.stop()
+
+    key = stream_key("batched-session")
+    entries = await redis_client.xrange(key)
+    assert len(entries) == 20
+    assert await redis_client.ttl(key) > 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +17,7 @@ from netherbrain.agent_runtime.execution.resolver import (
     WorkspaceNotFoundError,
     resolve_config,
 )
+from netherbrain.agent_runtime.managers.presets import invalidate_preset_cache
 from netherbrain.agent_runtime.models.enums import EnvironmentMode
 from netherbrain.agent_runtime.models.preset import (
     EnvironmentSpec,
@@ -111,6 +114,58 @@ async def test_resolve_preset_not_found_raises(db_session: AsyncSession) -> None
         await resolve_config(db_session, preset_id="ghost")
 
 
+async def test_preset_served_from_cache_until_invalidated() -> None:
+    row = Preset(
+        preset_id="cached",
+        name="Test",
+        model=MINIMAL_MODEL,
+        system_prompt="v1",
+        toolsets=[],
+        environment={},
+        tool_config={},
+        subagents={},
+        mcp_servers=[],
+    )
+    db = MagicMock()
+    db.get = AsyncMock(return_value=row)
+
+    first = await resolve_config(db, preset_id="cached")
+    row.system_prompt = "v2"
+    second = await resolve_config(db, preset_id="cached")
+
+    assert db.get.await_count == 1
+    assert first.system_prompt == second.system_prompt == "v1"
+
+    invalidate_preset_cache()
+    third = await resolve_config(db, preset_id="cached")
+
+    assert db.get.await_count == 2
+    assert third.system_prompt == "v2"
+
+
+async def test_overridden_fields_skip_preset_validation() -> None:
+    # Stored values that would fail validation are never touched when overridden.
+    row = Preset(
+        preset_id="broken",
+        name="Test",
+        model={},
+        system_prompt="p",
+        toolsets=[{}],
+        environment={},
+        tool_config={},
+        subagents={},
+        mcp_servers=[],
+    )
+    db = MagicMock()
+    db.get = AsyncMock(return_value=row)
+    override = ConfigOverride(model=ModelPreset(name="openai:gpt-4o"), toolsets=[])
+
+    cfg = await resolve_config(db, preset_id="broken", override=override)
+
+    assert cfg.model.name == "openai:gpt-4o"
+    assert cfg.toolsets == []
+
+
 # ---------------------------------------------------------------------------
 # Override merging
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 from netherbrain.agent_runtime.execution.mcp import McpConfig
 from netherbrain.agent_runtime.execution.runtime import (
     TOOLSET_REGISTRY,
+    _ToolsetRegistry,
     resolve_model_config,
     resolve_model_settings,
     resolve_tools,
@@ -22,6 +23,18 @@ from netherbrain.agent_runtime.models.preset import McpServerSpec, McpTransport,
 # ---------------------------------------------------------------------------
 
 
+def test_toolset_registry_imports_on_first_access() -> None:
+    from netherbrain.agent_runtime.toolsets import control
+
+    registry = _ToolsetRegistry({"control": "netherbrain.agent_runtime.toolsets.control"})
+
+    assert list(registry) == ["control"]
+    assert registry._loaded == {}
+    assert registry["control"] is control.tools
+    assert registry._loaded == {"control": control.tools}
+    assert registry.get("unknown") is None
+
+
 def test_resolve_tools_single_toolset() -> None:
     specs = [ToolsetSpec(toolset_name="shell")]
     tools = resolve_tools(specs)
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -186,6 +191,21 @@ async def test_list_sessions(manager: SessionManager, db_session: AsyncSession,
     assert len(sessions) == 2
 
 
+@pytest.mark.integration
+async def test_list_sessions_after_cursor(manager: SessionManager, db_session: AsyncSession, test_user: User) -> None:
+    root = await manager.create_session(db_session, user_id=TEST_USER_ID)
+    child = await manager.create_session(db_session, parent_session_id=root.session_id)
+
+    page = await manager.list_sessions(db_session, root.conversation_id, after=root.session_id)
+    assert [s.session_id for s in page] == [child.session_id]
+
+    page = await manager.list_sessions(db_session, root.conversation_id, after=child.session_id)
+    assert page == []
+
+    with pytest.raises(LookupError):
+        await manager.list_sessions(db_session, root.conversation_id, after="deleted-session")
+
+
 @pytest.mark.integration
 async def test_conversation_turns(manager: SessionManager, db_session: AsyncSession, test_user: User) -> None:
     """Turns returns input/final_message pairs from PG."""
@@ -245,6 +265,46 @@ async def test_recover_orphaned_sessions(manager: SessionManager, db_session: As
 # ---------------------------------------------------------------------------
 
 
+class _GatedRecoveryDB:
+    """Stands in for AsyncSession: the orphan UPDATE blocks until *gate* is set."""
+
+    def __init__(self, gate: asyncio.Event) -> None:
+        self._gate = gate
+
+    async def execute(self, _stmt: object) -> SimpleNamespace:
+        await self._gate.wait()
+        return SimpleNamespace(rowcount=2)
+
+    async def commit(self) -> None:
+        return None
+
+
+async def test_start_recovery_runs_in_background(manager: SessionManager) -> None:
+    gate = asyncio.Event()
+
+    @contextlib.asynccontextmanager
+    async def factory():
+        yield _GatedRecoveryDB(gate)
+
+    task = manager.start_recovery(factory)  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+    assert not manager.recovered
+
+    gate.set()
+    assert await task == 2
+    assert manager.recovered
+
+
+async def test_start_recovery_failure_still_marks_recovered(manager: SessionManager) -> None:
+    @contextlib.asynccontextmanager
+    async def factory():
+        raise ConnectionError
+        yield
+
+    assert await manager.start_recovery(factory) == 0  # type: ignore[arg-type]
+    assert manager.recovered
+
+
 @pytest.mark.integration
 async def test_conversation_update(client: AsyncClient, db_session: AsyncSession) -> None:
     """POST /conversations/{id}/update modifies conversation fields."""
@@ -313,3 +373,42 @@ async def test_session_get_endpoint(client: AsyncClient, db_session: AsyncSessio
 async def test_session_get_not_found(client: AsyncClient) -> None:
     resp = await client.get("/api/sessions/nonexistent/get")
     assert resp.status_code == 404
+
+
+async def test_commit_session_store_failure_rolls_back(registry: SessionRegistry) -> None:
+    """A failed state write leaves no pending UPDATE on the caller's session."""
+    store = AsyncMock()
+    store.write_state.side_effect = OSError("disk full")
+    manager = SessionManager(store=store, registry=registry)
+    db = AsyncMock()
+
+    with pytest.raises(OSError, match="disk full"):
+        await manager.commit_session(db, "s-1", state=SessionState())
+
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+async def test_commit_session_store_failure_waits_for_update(registry: SessionRegistry) -> None:
+    """The rollback only runs once the concurrent UPDATE has finished."""
+    store = AsyncMock()
+    store.write_state.side_effect = OSError("disk full")
+    manager = SessionManager(store=store, registry=registry)
+    db = AsyncMock()
+    calls: list[str] = []
+
+    async def slow_execute(*_args: object, **_kwargs: object) -> None:
+        await asyncio.sleep(0.01)
+        calls.append("execute")
+
+    async def rollback() -> None:
+        calls.append("rollback")
+
+    db.execute.side_effect = slow_execute
+    db.rollback.side_effect = rollback
+
+    with pytest.raises(OSError, match="disk full"):
+        await manager.commit_session(db, "s-1", state=SessionState())
+
+    assert calls == ["execute", "rollback"]
+    db.commit.assert_not_awaited()
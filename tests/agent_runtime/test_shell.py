@@ -286,6 +286,7 @@ def test_shell_websocket_requires_auth(tmp_path: Path) -> None:
 
     # Set minimal app state.
     app.state.auth_token = "test-token"  # noqa: S105
+    app.state.auth_token_bytes = b"test-token"
     app.state.jwt_secret = "test-jwt-secret-32bytes-minimum!"  # noqa: S105
     app.state.jwt_expiry_days = 7
     app.state.db_engine = None
@@ -319,6 +320,7 @@ def test_shell_websocket_project_not_found(tmp_path: Path) -> None:
     _get_settings_cached.cache_clear()
 
     app.state.auth_token = token
+    app.state.auth_token_bytes = token.encode()
     app.state.jwt_secret = "test-jwt-secret-32bytes-minimum!"  # noqa: S105
     app.state.jwt_expiry_days = 7
     app.state.db_engine = None
@@ -362,6 +364,7 @@ def test_shell_websocket_full_session(tmp_path: Path) -> None:
 
     shell_registry = ShellRegistry()
     app.state.auth_token = token
+    app.state.auth_token_bytes = token.encode()
     app.state.jwt_secret = "test-jwt-secret-32bytes-minimum!"  # noqa: S105
     app.state.jwt_expiry_days = 7
     app.state.db_engine = None
@@ -5,6 +5,8 @@ No database or Docker required -- uses a temporary directory.
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from netherbrain.agent_runtime.models.session import SessionState
@@ -188,6 +190,16 @@ async def test_display_messages_file_path(tmp_path) -> None:
     assert expected.exists()
 
 
+async def test_display_messages_file_format(tmp_path) -> None:
+    """The file stays indented UTF-8 JSON, as ``json.dumps(..., ensure_ascii=False, indent=2)`` wrote it."""
+    store = LocalStateStore(tmp_path)
+    messages = [{"type": "TEXT_MESSAGE_CHUNK", "delta": "héllo 世界", "n": 1, "ok": True, "extra": None}]
+    await store.write_display_messages("sess-1", messages)
+
+    raw = (tmp_path / "sessions" / "sess-1" / "display_messages.json").read_bytes()
+    assert raw == json.dumps(messages, ensure_ascii=False, indent=2).encode()
+
+
 async def test_delete_removes_display_messages(store: LocalStateStore) -> None:
     """Delete should remove both state.json and display_messages.json."""
     state = SessionState()
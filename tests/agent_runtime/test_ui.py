@@ -0,0 +1,29 @@
+"""Tests for static UI serving."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_PROBE = """
+from fastapi.testclient import TestClient
+from netherbrain.agent_runtime.app import app
+
+print(TestClient(app).get("/some/client/route").status_code)
+"""
+
+
+def test_ui_without_index_html_still_imports(tmp_path: Path) -> None:
+    """A partial UI build (no index.html) must not break the API import."""
+    (tmp_path / "assets").mkdir()
+    env = {**os.environ, "NETHER_UI_DIR": str(tmp_path)}
+
+    # The UI directory is read at import time, hence a fresh interpreter.
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True, timeout=60, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "404"
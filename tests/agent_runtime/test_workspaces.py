@@ -54,3 +54,28 @@ async def test_workspace_duplicate(client: AsyncClient) -> None:
     assert resp1.status_code == 201
     resp2 = await client.post("/api/workspaces/create", json=payload)
     assert resp2.status_code == 409
+
+
+@pytest.mark.integration
+async def test_workspace_list_before_cursor(client: AsyncClient) -> None:
+    for ws_id in ("ws-page-1", "ws-page-2", "ws-page-3"):
+        resp = await client.post("/api/workspaces/create", json={"workspace_id": ws_id, "projects": []})
+        assert resp.status_code == 201
+
+    resp = await client.get("/api/workspaces/list", params={"limit": 2})
+    first_page = [w["workspace_id"] for w in resp.json()]
+    assert len(first_page) == 2
+
+    resp = await client.get("/api/workspaces/list", params={"limit": 2, "before": first_page[-1]})
+    second_page = [w["workspace_id"] for w in resp.json()]
+    assert len(second_page) == 1
+    assert set(first_page + second_page) == {"ws-page-1", "ws-page-2", "ws-page-3"}
+
+
+@pytest.mark.integration
+async def test_workspace_list_unknown_cursor(client: AsyncClient) -> None:
+    resp = await client.get("/api/workspaces/list", params={"before": "ws-gone"})
+    assert resp.status_code == 404
+
+    resp = await client.get("/api/workspaces/list", params={"before": "ws-gone", "offset": 5})
+    assert resp.status_code == 422